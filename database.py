@@ -6,12 +6,39 @@ web interface. Each function wraps a query so callers don't need to know SQL.
 
 from __future__ import annotations
 
+import json
 import sqlite3
-from typing import Dict, Iterable, Optional, List
+import time
+from typing import Dict, Iterable, Optional, List, Tuple
 from datetime import datetime
 
 DB_PATH = "episodes.db"
 
+# Tables whose changes are counted in table_versions (see get_table_versions)
+VERSIONED_TABLES = ("feeds", "episodes", "articles", "jira_tickets")
+
+# File extensions that mark an episode URL as audio rather than a text article
+AUDIO_EXTENSIONS = (".mp3", ".m4a", ".wav", ".ogg", ".aac", ".flac")
+
+
+def item_type_for_url(url: str) -> str:
+    """Return 'audio' for audio file URLs (query string ignored), else 'text'.
+
+    This is only a guess for rows stored before ``item_type`` existed; new
+    rows get their type from the pipeline that created them.
+    """
+    return "audio" if url.lower().split("?", 1)[0].endswith(AUDIO_EXTENSIONS) else "text"
+
+
+def _unicode_lower(value):
+    """SQLite ``unicode_lower()``: Python's str.lower, unlike SQLite's ASCII-only lower()."""
+    return value.lower() if isinstance(value, str) else value
+
+
+def _register_text_functions(conn: sqlite3.Connection) -> None:
+    """Make ``unicode_lower()`` available to search queries on ``conn``."""
+    conn.create_function("unicode_lower", 1, _unicode_lower, deterministic=True)
+
 
 def init_db(db_path: str = DB_PATH) -> None:
     """Create tables if the database file is empty."""
@@ -41,6 +68,10 @@ def init_db(db_path: str = DB_PATH) -> None:
             conn.execute("ALTER TABLE feeds ADD COLUMN item_count INTEGER")
         if "last_checked" not in columns:
             conn.execute("ALTER TABLE feeds ADD COLUMN last_checked TEXT")
+        if "etag" not in columns:
+            conn.execute("ALTER TABLE feeds ADD COLUMN etag TEXT")
+        if "modified" not in columns:
+            conn.execute("ALTER TABLE feeds ADD COLUMN modified TEXT")
         # Each processed episode is stored here along with its state
         conn.execute(
             """
@@ -166,6 +197,20 @@ def init_db(db_path: str = DB_PATH) -> None:
         sched_columns = [row[1] for row in cur.fetchall()]
         if "standalone_post_id" not in sched_columns:
             conn.execute("ALTER TABLE scheduled_posts ADD COLUMN standalone_post_id INTEGER")
+        # Index for looking up and removing a standalone post's queue entries
+        conn.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_scheduled_standalone_status
+            ON scheduled_posts(standalone_post_id, status)
+            """
+        )
+        # Index for the scheduler's "pending and due" range scan
+        conn.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_sched_status_time
+            ON scheduled_posts(status, scheduled_for)
+            """
+        )
         # Schedule settings for configurable time slots
         conn.execute(
             """
@@ -242,10 +287,33 @@ def init_db(db_path: str = DB_PATH) -> None:
                 url TEXT UNIQUE,
                 storage TEXT,
                 size INTEGER,
-                created_at TEXT
+                created_at TEXT,
+                created_at_ts REAL
             )
             """
         )
+        # Cached LLM generation responses keyed by a hash of the request inputs
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS generation_cache (
+                cache_key TEXT PRIMARY KEY,
+                response_json TEXT,
+                created_at TEXT,
+                expires_at REAL
+            )
+            """
+        )
+        # Upgrade uploaded_images table to include created_at_ts (epoch seconds) if missing
+        cur = conn.execute("PRAGMA table_info(uploaded_images)")
+        image_columns = [row[1] for row in cur.fetchall()]
+        if "created_at_ts" not in image_columns:
+            conn.execute("ALTER TABLE uploaded_images ADD COLUMN created_at_ts REAL")
+            conn.execute(
+                """
+                UPDATE uploaded_images
+                SET created_at_ts = COALESCE(CAST(strftime('%s', created_at) AS REAL), 0)
+                """
+            )
         # Upgrade any existing DB with newer columns
         cur = conn.execute("PRAGMA table_info(episodes)")
         columns = [row[1] for row in cur.fetchall()]
@@ -256,9 +324,92 @@ def init_db(db_path: str = DB_PATH) -> None:
             conn.execute("ALTER TABLE episodes ADD COLUMN published TEXT")
         if "processed_at" not in columns:
             conn.execute("ALTER TABLE episodes ADD COLUMN processed_at TEXT")
+        if "description" not in columns:
+            conn.execute("ALTER TABLE episodes ADD COLUMN description TEXT")
+        # Action items used to be newline separated text; store them as JSON
+        legacy = conn.execute(
+            "SELECT id, action_items FROM episodes WHERE action_items NOT LIKE '[%'"
+        ).fetchall()
+        if legacy:
+            conn.executemany(
+                "UPDATE episodes SET action_items = ? WHERE id = ?",
+                [(json.dumps(text.splitlines()), ep_id) for ep_id, text in legacy],
+            )
+        if "item_type" not in columns:
+            conn.execute("ALTER TABLE episodes ADD COLUMN item_type TEXT")
+            rows = conn.execute("SELECT id, url FROM episodes").fetchall()
+            conn.executemany(
+                "UPDATE episodes SET item_type = ? WHERE id = ?",
+                [(item_type_for_url(url or ""), ep_id) for ep_id, url in rows],
+            )
+        # Indexes for the status page's filters and per-feed listings
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_episodes_status ON episodes(status)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_episodes_item_type ON episodes(item_type)")
+        conn.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_episodes_feed_published
+            ON episodes(feed_id, published DESC)
+            """
+        )
+        # The feed list sorts by title or last post and filters by type; the
+        # expressions match list_feeds so SQLite can walk the index directly
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_feeds_title ON feeds(title COLLATE NOCASE)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_feeds_last_post ON feeds(last_post)")
+        conn.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_feeds_type
+            ON feeds(COALESCE(feed_type, 'unknown'))
+            """
+        )
+        # Per-table change counters, bumped by triggers, so list pages can
+        # answer conditional requests without re-running their queries
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS table_versions (
+                name TEXT PRIMARY KEY,
+                version INTEGER NOT NULL DEFAULT 0
+            )
+            """
+        )
+        for table in VERSIONED_TABLES:
+            conn.execute(
+                "INSERT OR IGNORE INTO table_versions (name, version) VALUES (?, 0)",
+                (table,),
+            )
+            for event in ("INSERT", "UPDATE", "DELETE"):
+                conn.execute(
+                    f"""
+                    CREATE TRIGGER IF NOT EXISTS trg_{table}_{event.lower()}_version
+                    AFTER {event} ON {table}
+                    BEGIN
+                        UPDATE table_versions SET version = version + 1 WHERE name = '{table}';
+                    END
+                    """
+                )
         conn.commit()
 
 
+def get_table_versions(tables: Iterable[str], db_path: str = DB_PATH) -> Dict[str, int]:
+    """Return the change counter of each requested table.
+
+    Args:
+        tables: Names from ``VERSIONED_TABLES``
+
+    Returns:
+        Dict mapping table name -> number of row changes seen so far
+    """
+    tables = list(tables)
+    placeholders = ",".join("?" * len(tables))
+    with sqlite3.connect(db_path) as conn:
+        cur = conn.execute(
+            f"SELECT name, version FROM table_versions WHERE name IN ({placeholders})",
+            tables,
+        )
+        return dict(cur.fetchall())
+
+
 def get_feed(url: str, db_path: str = DB_PATH) -> Optional[sqlite3.Row]:
     """Retrieve a feed record by its RSS URL."""
     with sqlite3.connect(db_path) as conn:
@@ -275,11 +426,45 @@ def get_feed_by_id(feed_id: int, db_path: str = DB_PATH) -> Optional[sqlite3.Row
         return cur.fetchone()
 
 
-def list_feeds(db_path: str = DB_PATH) -> List[sqlite3.Row]:
-    """Return all stored feeds ordered by title."""
+def list_feeds(
+    feed_type: Optional[str] = None,
+    search: Optional[str] = None,
+    order_by: str = "title",
+    descending: bool = False,
+    db_path: str = DB_PATH,
+) -> List[sqlite3.Row]:
+    """Return stored feeds, optionally filtered and sorted.
+
+    Args:
+        feed_type: Only feeds of this type ('audio', 'text' or 'unknown')
+        search: Case-insensitive substring the title must contain
+        order_by: One of 'title', 'last_post', 'type' or 'items'
+        descending: Reverse the sort order
+
+    Returns:
+        List of feed rows
+    """
+    columns = {
+        "title": "title COLLATE NOCASE",
+        "last_post": "last_post",
+        "type": "COALESCE(feed_type, 'unknown')",
+        "items": "COALESCE(item_count, 0)",
+    }
+    column = columns.get(order_by, columns["title"])
+    direction = "DESC" if descending else "ASC"
+    clauses = []
+    params: list = []
+    if feed_type:
+        clauses.append("COALESCE(feed_type, 'unknown') = ?")
+        params.append(feed_type)
+    if search:
+        clauses.append("instr(unicode_lower(title), ?) > 0")
+        params.append(search.lower())
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
     with sqlite3.connect(db_path) as conn:
         conn.row_factory = sqlite3.Row
-        cur = conn.execute("SELECT * FROM feeds ORDER BY title")
+        _register_text_functions(conn)
+        cur = conn.execute(f"SELECT * FROM feeds {where} ORDER BY {column} {direction}", params)
         return cur.fetchall()
 
 
@@ -372,19 +557,34 @@ def update_feed_metadata(
     feed_type: str,
     last_post: str | None,
     item_count: int,
+    etag: str | None = None,
+    modified: str | None = None,
     db_path: str = DB_PATH,
 ) -> None:
-    """Update cached metadata for a feed."""
+    """Update cached metadata and HTTP validators for a feed."""
     from datetime import datetime
     last_checked = datetime.utcnow().isoformat(timespec="seconds")
     with sqlite3.connect(db_path) as conn:
         conn.execute(
             """
             UPDATE feeds 
-            SET feed_type = ?, last_post = ?, item_count = ?, last_checked = ?
+            SET feed_type = ?, last_post = ?, item_count = ?, last_checked = ?,
+                etag = ?, modified = ?
             WHERE id = ?
             """,
-            (feed_type, last_post, item_count, last_checked, feed_id),
+            (feed_type, last_post, item_count, last_checked, etag, modified, feed_id),
+        )
+        conn.commit()
+
+
+def touch_feed_checked(feed_id: int, db_path: str = DB_PATH) -> None:
+    """Record that a feed was checked and found unchanged."""
+    from datetime import datetime
+    last_checked = datetime.utcnow().isoformat(timespec="seconds")
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "UPDATE feeds SET last_checked = ? WHERE id = ?",
+            (last_checked, feed_id),
         )
         conn.commit()
 
@@ -397,6 +597,54 @@ def get_episode(url: str, db_path: str = DB_PATH) -> Optional[sqlite3.Row]:
         return cur.fetchone()
 
 
+def get_episodes_by_urls(urls: List[str], db_path: str = DB_PATH) -> Dict[str, sqlite3.Row]:
+    """Retrieve the processing state of several audio/article URLs at once.
+
+    Only the flags a feed listing needs are selected, so full transcripts and
+    summaries are never read just to test whether they exist.
+
+    Args:
+        urls: Episode URLs to look up
+
+    Returns:
+        Dict mapping url -> row with ``url``, ``status``, ``transcribed``,
+        ``summarized`` and ``has_actions`` (unprocessed urls are simply absent)
+    """
+    episodes: Dict[str, sqlite3.Row] = {}
+    if not urls:
+        return episodes
+    urls = list(dict.fromkeys(urls))
+    with sqlite3.connect(db_path) as conn:
+        conn.row_factory = sqlite3.Row
+        # Stay under SQLite's default limit of 999 bound parameters
+        for i in range(0, len(urls), 900):
+            chunk = urls[i:i + 900]
+            placeholders = ",".join("?" * len(chunk))
+            cur = conn.execute(
+                f"""
+                SELECT url, status,
+                       COALESCE(transcript, '') != '' AS transcribed,
+                       COALESCE(summary, '') != '' AS summarized,
+                       COALESCE(action_items, '[]') NOT IN ('', '[]') AS has_actions
+                FROM episodes WHERE url IN ({placeholders})
+                """,
+                chunk,
+            )
+            episodes.update((row['url'], row) for row in cur)
+    return episodes
+
+
+def load_action_items(value: Optional[str]) -> List[str]:
+    """Decode an episode's stored ``action_items`` column into a list."""
+    if not value:
+        return []
+    try:
+        return json.loads(value)
+    except ValueError:
+        # Rows written before the JSON migration hold newline separated text
+        return value.splitlines()
+
+
 def save_episode(
     url: str,
     title: str,
@@ -405,40 +653,65 @@ def save_episode(
     action_items: Iterable[str],
     feed_id: int,
     published: str | None = None,
+    description: str | None = None,
+    item_type: str = "audio",
     db_path: str = DB_PATH,
 ) -> None:
-    """Persist a fully processed episode."""
-    # Store the list of action items as newline separated text
-    actions = "\n".join(action_items)
+    """Persist a fully processed episode.
+
+    ``item_type`` is 'audio' for transcribed episodes or 'text' for articles;
+    callers know which pipeline produced the row, so it isn't guessed from
+    the URL.
+    """
+    # Store the list of action items as a JSON array
+    actions = json.dumps(list(action_items))
     processed_at = datetime.utcnow().isoformat(timespec="seconds")
     with sqlite3.connect(db_path) as conn:
         conn.execute(
             """
             INSERT OR REPLACE INTO episodes
-                (url, title, transcript, summary, action_items, feed_id, status, published, processed_at)
-            VALUES (?, ?, ?, ?, ?, ?, 'complete', ?, ?)
+                (url, title, transcript, summary, action_items, feed_id, status, published,
+                 processed_at, description, item_type)
+            VALUES (?, ?, ?, ?, ?, ?, 'complete', ?, ?, ?, ?)
             """,
-            (url, title, transcript, summary, actions, feed_id, published, processed_at),
+            (
+                url, title, transcript, summary, actions, feed_id, published,
+                processed_at, description, item_type,
+            ),
         )  # episode is complete once saved
         conn.commit()
 
 
+def set_episode_description(url: str, description: str, db_path: str = DB_PATH) -> None:
+    """Store the cleaned feed description for an already saved episode."""
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "UPDATE episodes SET description = ? WHERE url = ?",
+            (description, url),
+        )
+        conn.commit()
+
+
 def queue_episode(
     url: str,
     title: str,
     feed_id: int,
     published: str | None = None,
+    item_type: str = "audio",
     db_path: str = DB_PATH,
 ) -> None:
-    """Mark an episode as awaiting background processing."""
+    """Mark an episode as awaiting background processing.
+
+    Only the audio pipeline queues work, so ``item_type`` defaults to 'audio'.
+    """
     with sqlite3.connect(db_path) as conn:
         # Insert only if we haven't seen this URL before
         conn.execute(
             """
-            INSERT OR IGNORE INTO episodes (url, title, feed_id, status, published)
-            VALUES (?, ?, ?, 'queued', ?)
+            INSERT OR IGNORE INTO episodes (url, title, feed_id, status, published, item_type)
+            VALUES (?, ?, ?, 'queued', ?, ?)
             """,
-            (url, title, feed_id, published),
+            (url, title, feed_id, published, item_type),
         )
         conn.commit()
 
@@ -453,6 +726,16 @@ def update_episode_status(url: str, status: str, db_path: str = DB_PATH) -> None
         conn.commit()
 
 
+def list_unfinished_episodes(db_path: str = DB_PATH) -> List[sqlite3.Row]:
+    """Return episodes left queued or mid-processing (e.g. by a restart)."""
+    with sqlite3.connect(db_path) as conn:
+        conn.row_factory = sqlite3.Row
+        cur = conn.execute(
+            "SELECT * FROM episodes WHERE status IN ('queued', 'processing') ORDER BY id"
+        )
+        return cur.fetchall()
+
+
 def get_episode_by_id(episode_id: int, db_path: str = DB_PATH) -> Optional[sqlite3.Row]:
     """Retrieve an episode by its database ID."""
     with sqlite3.connect(db_path) as conn:
@@ -524,14 +807,62 @@ def list_episodes(feed_id: int, db_path: str = DB_PATH) -> List[sqlite3.Row]:
         return cur.fetchall()
 
 
-def list_all_episodes(order_by: str = "id", db_path: str = DB_PATH) -> List[sqlite3.Row]:
-    """List episodes from all feeds ordered by the provided column."""
+def list_all_episodes(
+    order_by: str = "id",
+    descending: Optional[bool] = None,
+    status: Optional[str] = None,
+    feed_id: Optional[int] = None,
+    item_type: Optional[str] = None,
+    search: Optional[str] = None,
+    limit: Optional[int] = None,
+    offset: int = 0,
+    db_path: str = DB_PATH,
+) -> List[sqlite3.Row]:
+    """List episodes from all feeds, filtered and ordered in SQL.
+
+    Args:
+        order_by: One of 'id', 'published' or 'processed_at'
+        descending: Sort direction; ``None`` keeps the column's default
+            (newest first for dates, oldest first for ids)
+        status: Only episodes with this processing status
+        feed_id: Only episodes from this feed
+        item_type: Only 'audio' or only 'text' episodes
+        search: Case-insensitive substring the title must contain
+        limit: Maximum number of rows to return (``None`` for all)
+        offset: Number of rows to skip
+
+    Returns:
+        List of episode rows
+    """
     valid = {"id", "published", "processed_at"}
     column = order_by if order_by in valid else "id"
-    direction = "DESC" if column in {"published", "processed_at"} else "ASC"
+    if descending is None:
+        descending = column in {"published", "processed_at"}
+    direction = "DESC" if descending else "ASC"
+    clauses = []
+    params: list = []
+    if status:
+        clauses.append("status = ?")
+        params.append(status)
+    if feed_id is not None:
+        clauses.append("feed_id = ?")
+        params.append(feed_id)
+    if item_type:
+        clauses.append("item_type = ?")
+        params.append(item_type)
+    if search:
+        clauses.append("instr(unicode_lower(COALESCE(title, '')), ?) > 0")
+        params.append(search.lower())
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    # SQLite treats a negative LIMIT as "no limit"
+    params.extend([limit if limit is not None else -1, offset])
     with sqlite3.connect(db_path) as conn:
         conn.row_factory = sqlite3.Row
-        cur = conn.execute(f"SELECT * FROM episodes ORDER BY {column} {direction}")
+        _register_text_functions(conn)
+        cur = conn.execute(
+            f"SELECT * FROM episodes {where} ORDER BY {column} {direction} LIMIT ? OFFSET ?",
+            params,
+        )
         return cur.fetchall()
 
 
@@ -554,39 +885,81 @@ def add_ticket(
         conn.commit()
 
 
+def add_tickets(
+    episode_id: int,
+    tickets: Iterable[Tuple[str, str, str]],
+    db_path: str = DB_PATH,
+) -> None:
+    """Save several JIRA tickets for one episode in a single transaction.
+
+    Args:
+        episode_id: Episode the tickets were created from
+        tickets: (action_item, ticket_key, ticket_url) tuples
+    """
+    with sqlite3.connect(db_path) as conn:
+        conn.executemany(
+            """
+            INSERT INTO jira_tickets (episode_id, action_item, ticket_key, ticket_url)
+            VALUES (?, ?, ?, ?)
+            """,
+            [(episode_id, item, key, url) for item, key, url in tickets],
+        )
+        conn.commit()
+
+
 def list_tickets(
-    episode_id: Optional[int] | None = None, db_path: str = DB_PATH
+    episode_id: Optional[int] | None = None,
+    search: Optional[str] = None,
+    order_by: str = "id",
+    descending: bool = False,
+    db_path: str = DB_PATH,
 ) -> List[sqlite3.Row]:
-    """List all JIRA tickets or those for a specific episode."""
+    """List all JIRA tickets or those for a specific episode.
+
+    Args:
+        episode_id: Only tickets for this episode
+        search: Case-insensitive substring of the episode title, action item
+            or ticket key
+        order_by: One of 'id', 'episode' or 'ticket'
+        descending: Reverse the sort order
+
+    Returns:
+        List of ticket rows joined with their episode context
+    """
+    columns = {
+        "id": "jt.id",
+        "episode": "COALESCE(e.title, '') COLLATE NOCASE",
+        "ticket": "jt.ticket_key",
+    }
+    column = columns.get(order_by, columns["id"])
+    direction = "DESC" if descending else "ASC"
+    clauses = []
+    params: list = []
+    if episode_id is not None:
+        # Only tickets for a specific episode
+        clauses.append("jt.episode_id = ?")
+        params.append(episode_id)
+    if search:
+        clauses.append(
+            "instr(unicode_lower(COALESCE(e.title, '') || ' ' || jt.action_item || ' ' || jt.ticket_key), ?) > 0"
+        )
+        params.append(search.lower())
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
     with sqlite3.connect(db_path) as conn:
         conn.row_factory = sqlite3.Row
+        _register_text_functions(conn)
         # Build a query that joins ticket info with episode context
-        columns = (
-            "jt.*, e.title AS episode_title, e.summary AS episode_summary,"
-            " e.url AS episode_url, e.feed_id AS feed_id, e.published AS published"
+        cur = conn.execute(
+            f"""
+            SELECT jt.*, e.title AS episode_title, e.summary AS episode_summary,
+                   e.url AS episode_url, e.feed_id AS feed_id, e.published AS published
+            FROM jira_tickets jt
+            JOIN episodes e ON jt.episode_id = e.id
+            {where}
+            ORDER BY {column} {direction}
+            """,
+            params,
         )
-        if episode_id is None:
-            # All tickets across every episode
-            cur = conn.execute(
-                f"""
-                SELECT {columns}
-                FROM jira_tickets jt
-                JOIN episodes e ON jt.episode_id = e.id
-                ORDER BY jt.id
-                """
-            )
-        else:
-            # Only tickets for a specific episode
-            cur = conn.execute(
-                f"""
-                SELECT {columns}
-                FROM jira_tickets jt
-                JOIN episodes e ON jt.episode_id = e.id
-                WHERE jt.episode_id = ?
-                ORDER BY jt.id
-                """,
-                (episode_id,),
-            )
         return cur.fetchall()
 
 
@@ -692,36 +1065,97 @@ def delete_article(article_id: int, db_path: str = DB_PATH) -> None:
 
 
 def list_articles(
-    episode_id: Optional[int] = None, db_path: str = DB_PATH
+    episode_id: Optional[int] = None,
+    style: Optional[str] = None,
+    podcast: Optional[str] = None,
+    search: Optional[str] = None,
+    order_by: str = "date",
+    descending: bool = True,
+    limit: Optional[int] = None,
+    offset: int = 0,
+    db_path: str = DB_PATH,
 ) -> List[sqlite3.Row]:
-    """List articles, optionally filtered by episode."""
+    """List articles, optionally filtered by episode.
+
+    Args:
+        episode_id: Only articles generated from this episode
+        style: Only articles written in this style
+        podcast: Only articles from the feed with this title
+        search: Case-insensitive substring of the topic, episode or feed title
+        order_by: One of 'date', 'topic', 'style' or 'podcast'
+        descending: Reverse the sort order (newest first by default)
+        limit: Maximum number of rows to return (``None`` for all)
+        offset: Number of rows to skip
+
+    Returns:
+        List of article rows joined with episode and feed titles
+    """
+    columns = {
+        "date": "COALESCE(a.created_at, '')",
+        "topic": "a.topic COLLATE NOCASE",
+        "style": "a.style COLLATE NOCASE",
+        "podcast": "COALESCE(f.title, '') COLLATE NOCASE",
+    }
+    column = columns.get(order_by, columns["date"])
+    direction = "DESC" if descending else "ASC"
+    clauses = []
+    params: list = []
+    if episode_id is not None:
+        clauses.append("a.episode_id = ?")
+        params.append(episode_id)
+    if style:
+        clauses.append("a.style = ?")
+        params.append(style)
+    if podcast:
+        clauses.append("f.title = ?")
+        params.append(podcast)
+    if search:
+        clauses.append(
+            "instr(unicode_lower(a.topic || ' ' || COALESCE(e.title, '') || ' ' || COALESCE(f.title, '')), ?) > 0"
+        )
+        params.append(search.lower())
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    # SQLite treats a negative LIMIT as "no limit"
+    params.extend([limit if limit is not None else -1, offset])
     with sqlite3.connect(db_path) as conn:
         conn.row_factory = sqlite3.Row
-        if episode_id is None:
-            cur = conn.execute(
+        _register_text_functions(conn)
+        cur = conn.execute(
+            f"""
+            SELECT a.*, e.title AS episode_title, e.url AS episode_url, e.feed_id,
+                   f.title AS podcast_title
+            FROM articles a
+            JOIN episodes e ON a.episode_id = e.id
+            LEFT JOIN feeds f ON e.feed_id = f.id
+            {where}
+            ORDER BY {column} {direction}
+            LIMIT ? OFFSET ?
+            """,
+            params,
+        )
+        return cur.fetchall()
+
+
+def list_article_filter_values(db_path: str = DB_PATH) -> Tuple[List[str], List[str]]:
+    """Return the distinct article styles and feed titles for filter dropdowns."""
+    with sqlite3.connect(db_path) as conn:
+        styles = [
+            row[0] for row in conn.execute("SELECT DISTINCT style FROM articles ORDER BY style")
+        ]
+        podcasts = [
+            row[0]
+            for row in conn.execute(
                 """
-                SELECT a.*, e.title AS episode_title, e.url AS episode_url, e.feed_id,
-                       f.title AS podcast_title
+                SELECT DISTINCT f.title
                 FROM articles a
                 JOIN episodes e ON a.episode_id = e.id
-                LEFT JOIN feeds f ON e.feed_id = f.id
-                ORDER BY a.created_at DESC
-                """
-            )
-        else:
-            cur = conn.execute(
+                JOIN feeds f ON e.feed_id = f.id
+                WHERE f.title IS NOT NULL AND f.title != ''
+                ORDER BY f.title
                 """
-                SELECT a.*, e.title AS episode_title, e.url AS episode_url, e.feed_id,
-                       f.title AS podcast_title
-                FROM articles a
-                JOIN episodes e ON a.episode_id = e.id
-                LEFT JOIN feeds f ON e.feed_id = f.id
-                WHERE a.episode_id = ?
-                ORDER BY a.created_at DESC
-                """,
-                (episode_id,),
             )
-        return cur.fetchall()
+        ]
+        return styles, podcasts
 
 
 # --- Social Posts Functions ---
@@ -1422,12 +1856,18 @@ def list_scheduled_posts(
         return cur.fetchall()
 
 
-def get_pending_scheduled_posts(db_path: str = DB_PATH) -> List[sqlite3.Row]:
-    """Get all pending scheduled posts that are due (scheduled_for <= now).
+def get_pending_scheduled_posts(
+    limit: Optional[int] = None,
+    before: Optional[str] = None,
+    db_path: str = DB_PATH,
+) -> List[sqlite3.Row]:
+    """Get pending scheduled posts that are due (scheduled_for <= now).
     
     Uses local time since time slots are configured in local time by users.
+    Pass ``limit`` to fetch the backlog in batches and ``before`` to pin the
+    cutoff time across those batches.
     """
-    now = datetime.now().isoformat(timespec="seconds")
+    now = before or datetime.now().isoformat(timespec="seconds")
     with sqlite3.connect(db_path) as conn:
         conn.row_factory = sqlite3.Row
         cur = conn.execute(
@@ -1445,12 +1885,22 @@ def get_pending_scheduled_posts(db_path: str = DB_PATH) -> List[sqlite3.Row]:
             LEFT JOIN standalone_posts st ON sp.standalone_post_id = st.id
             WHERE sp.status = 'pending' AND sp.scheduled_for <= ?
             ORDER BY sp.scheduled_for ASC
+            LIMIT ?
             """,
-            (now,),
+            (now, limit if limit is not None else -1),
         )
         return cur.fetchall()
 
 
+def get_next_scheduled_time(db_path: str = DB_PATH) -> Optional[str]:
+    """Return the earliest scheduled_for among pending posts, or None."""
+    with sqlite3.connect(db_path) as conn:
+        row = conn.execute(
+            "SELECT MIN(scheduled_for) FROM scheduled_posts WHERE status = 'pending'"
+        ).fetchone()
+        return row[0] if row else None
+
+
 def update_scheduled_post_time(
     scheduled_id: int,
     scheduled_for: str,
@@ -1738,6 +2188,17 @@ def delete_scheduled_post(scheduled_id: int, db_path: str = DB_PATH) -> None:
         conn.commit()
 
 
+def delete_scheduled_posts_by_standalone_id(standalone_post_id: int, db_path: str = DB_PATH) -> int:
+    """Delete pending scheduled posts for a standalone post. Returns count deleted."""
+    with sqlite3.connect(db_path) as conn:
+        cur = conn.execute(
+            "DELETE FROM scheduled_posts WHERE standalone_post_id = ? AND status = 'pending'",
+            (standalone_post_id,),
+        )
+        conn.commit()
+        return cur.rowcount
+
+
 def clear_pending_scheduled_posts(db_path: str = DB_PATH) -> int:
     """Clear all pending scheduled posts. Returns the count of deleted posts."""
     with sqlite3.connect(db_path) as conn:
@@ -1986,10 +2447,10 @@ def initialize_default_time_slots(db_path: str = DB_PATH) -> None:
         return  # Already have slots configured
     
     default_times = ["09:00", "12:00", "17:00"]
-    for time in default_times:
+    for slot_time in default_times:
         add_time_slot(
             day_of_week=-1,  # Every day
-            time_slot=time,
+            time_slot=slot_time,
             enabled=True,
             db_path=db_path,
         )
@@ -2103,6 +2564,42 @@ def add_standalone_post(
         return cur.lastrowid
 
 
+def add_standalone_posts_bulk(
+    source_type: str,
+    source_content: str,
+    posts: List[Tuple[str, str]],
+    image_url: Optional[str] = None,
+    db_path: str = DB_PATH,
+) -> List[int]:
+    """Save several standalone posts in one transaction and return their ids.
+    
+    Args:
+        source_type: 'freeform', 'url', 'text', or 'saved_source'
+        source_content: The original prompt, URL, or text used to generate
+        posts: (platform, content) pairs to insert
+        image_url: Optional URL of an image to attach to every post
+        
+    Returns:
+        The IDs of the newly created posts, in the same order as ``posts``
+    """
+    if not posts:
+        return []
+    created_at = datetime.utcnow().isoformat(timespec="seconds")
+    post_ids = []
+    with sqlite3.connect(db_path) as conn:
+        for platform, content in posts:
+            cur = conn.execute(
+                """
+                INSERT INTO standalone_posts (source_type, source_content, platform, content, image_url, created_at, used)
+                VALUES (?, ?, ?, ?, ?, ?, 0)
+                """,
+                (source_type, source_content, platform, content, image_url, created_at),
+            )
+            post_ids.append(cur.lastrowid)
+        conn.commit()
+    return post_ids
+
+
 def list_standalone_posts(
     source_type: Optional[str] = None,
     platform: Optional[str] = None,
@@ -2163,6 +2660,30 @@ def get_standalone_post(post_id: int, db_path: str = DB_PATH) -> Optional[sqlite
         return cur.fetchone()
 
 
+def get_standalone_posts_bulk(post_ids: List[int], db_path: str = DB_PATH) -> Dict[int, sqlite3.Row]:
+    """Retrieve multiple standalone posts in a single query.
+
+    Intended for bulk endpoints so they can look up every selected post
+    up front instead of issuing one query per id.
+
+    Args:
+        post_ids: List of post IDs to fetch
+
+    Returns:
+        Dict mapping post id -> post row (missing ids are simply absent)
+    """
+    if not post_ids:
+        return {}
+    placeholders = ",".join("?" * len(post_ids))
+    with sqlite3.connect(db_path) as conn:
+        conn.row_factory = sqlite3.Row
+        cur = conn.execute(
+            f"SELECT * FROM standalone_posts WHERE id IN ({placeholders})",
+            post_ids,
+        )
+        return {row['id']: row for row in cur}
+
+
 def update_standalone_post(
     post_id: int,
     content: str,
@@ -2267,6 +2788,26 @@ def delete_standalone_posts_bulk(post_ids: List[int], db_path: str = DB_PATH) ->
         return cur.rowcount
 
 
+def delete_all_standalone_posts(db_path: str = DB_PATH) -> int:
+    """Delete every standalone post and its pending queue entries.
+    
+    Posted schedule rows are kept as history.
+    
+    Returns:
+        Number of standalone posts deleted
+    """
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            """
+            DELETE FROM scheduled_posts
+            WHERE standalone_post_id IS NOT NULL AND status = 'pending'
+            """
+        )
+        cur = conn.execute("DELETE FROM standalone_posts")
+        conn.commit()
+        return cur.rowcount
+
+
 def mark_standalone_post_used(post_id: int, used: bool = True, db_path: str = DB_PATH) -> None:
     """Mark a standalone post as used or unused.
     
@@ -2282,6 +2823,33 @@ def mark_standalone_post_used(post_id: int, used: bool = True, db_path: str = DB
         conn.commit()
 
 
+def toggle_standalone_post_used(post_id: int, db_path: str = DB_PATH) -> Optional[bool]:
+    """Atomically flip a standalone post's used flag.
+
+    Uses ``UPDATE ... RETURNING`` (SQLite 3.35+) so the read and write
+    happen in a single statement.
+
+    Args:
+        post_id: The post ID
+
+    Returns:
+        The new used status, or None if the post does not exist
+    """
+    with sqlite3.connect(db_path) as conn:
+        cur = conn.execute(
+            """
+            UPDATE standalone_posts
+            SET used = CASE WHEN used THEN 0 ELSE 1 END
+            WHERE id = ?
+            RETURNING used
+            """,
+            (post_id,),
+        )
+        row = cur.fetchone()
+        conn.commit()
+        return bool(row[0]) if row else None
+
+
 # =============================================================================
 # URL Sources CRUD Functions
 # =============================================================================
@@ -2310,33 +2878,24 @@ def add_url_source(
     """
     created_at = datetime.utcnow().isoformat()
     with sqlite3.connect(db_path) as conn:
-        # Check if URL already exists
-        cur = conn.execute("SELECT id FROM url_sources WHERE url = ?", (url,))
-        existing = cur.fetchone()
-        
-        if existing:
-            # Update existing record
-            conn.execute(
-                """
-                UPDATE url_sources 
-                SET title = ?, description = ?, content = ?, og_image = ?, last_used_at = ?
-                WHERE id = ?
-                """,
-                (title, description, content, og_image, created_at, existing[0]),
-            )
-            conn.commit()
-            return existing[0]
-        else:
-            # Insert new record
-            cur = conn.execute(
-                """
-                INSERT INTO url_sources (url, title, description, content, og_image, created_at, last_used_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                (url, title, description, content, og_image, created_at, created_at),
-            )
-            conn.commit()
-            return cur.lastrowid
+        # Upsert on the UNIQUE url column so repeat saves update in place
+        cur = conn.execute(
+            """
+            INSERT INTO url_sources (url, title, description, content, og_image, created_at, last_used_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(url) DO UPDATE SET
+                title = excluded.title,
+                description = excluded.description,
+                content = excluded.content,
+                og_image = excluded.og_image,
+                last_used_at = excluded.last_used_at
+            RETURNING id
+            """,
+            (url, title, description, content, og_image, created_at, created_at),
+        )
+        source_id = cur.fetchone()[0]
+        conn.commit()
+        return source_id
 
 
 def list_url_sources(db_path: str = DB_PATH) -> List[sqlite3.Row]:
@@ -2482,19 +3041,21 @@ def add_uploaded_image(
         The id of the inserted record
     """
     created_at = datetime.utcnow().isoformat()
+    # Epoch seconds stored alongside so listings can sort without re-parsing
+    created_at_ts = time.time()
     with sqlite3.connect(db_path) as conn:
         # Check if URL already exists (avoid duplicates)
         cur = conn.execute("SELECT id FROM uploaded_images WHERE url = ?", (url,))
         existing = cur.fetchone()
         if existing:
             return existing[0]
-        
+
         cur = conn.execute(
             """
-            INSERT INTO uploaded_images (filename, url, storage, size, created_at)
-            VALUES (?, ?, ?, ?, ?)
+            INSERT INTO uploaded_images (filename, url, storage, size, created_at, created_at_ts)
+            VALUES (?, ?, ?, ?, ?, ?)
             """,
-            (filename, url, storage, size, created_at),
+            (filename, url, storage, size, created_at, created_at_ts),
         )
         conn.commit()
         return cur.lastrowid
@@ -2660,3 +3221,58 @@ def delete_prompts_bulk(prompt_contents: List[str], db_path: str = DB_PATH) -> i
         )
         conn.commit()
         return cur.rowcount
+
+
+# =============================================================================
+# Generation Cache Functions
+# =============================================================================
+
+
+def get_generation_cache(cache_key: str, db_path: str = DB_PATH) -> Optional[str]:
+    """Return a cached LLM response if present and not expired.
+
+    Args:
+        cache_key: Hash of the generation inputs
+
+    Returns:
+        The cached JSON string, or None on a miss
+    """
+    with sqlite3.connect(db_path) as conn:
+        cur = conn.execute(
+            """
+            SELECT response_json FROM generation_cache
+            WHERE cache_key = ? AND expires_at > ?
+            """,
+            (cache_key, time.time()),
+        )
+        row = cur.fetchone()
+        return row[0] if row else None
+
+
+def set_generation_cache(
+    cache_key: str,
+    response_json: str,
+    ttl_seconds: int = 86400,
+    db_path: str = DB_PATH,
+) -> None:
+    """Store an LLM response in the cache, replacing any previous entry.
+
+    Expired rows are purged on each write so the table doesn't grow forever.
+
+    Args:
+        cache_key: Hash of the generation inputs
+        response_json: JSON-encoded response to cache
+        ttl_seconds: How long the entry stays valid (default 24 hours)
+    """
+    now = time.time()
+    created_at = datetime.utcnow().isoformat(timespec="seconds")
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("DELETE FROM generation_cache WHERE expires_at <= ?", (now,))
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO generation_cache (cache_key, response_json, created_at, expires_at)
+            VALUES (?, ?, ?, ?)
+            """,
+            (cache_key, response_json, created_at, now + ttl_seconds),
+        )
+        conn.commit()
@@ -11,6 +11,8 @@ from urllib.parse import urlencode
 from typing import Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
@@ -112,6 +114,18 @@ LINKEDIN_SCOPES = os.environ.get(
 )
 
 
+# Match http/https URLs, allowing balanced parentheses inside the path
+_URL_RE = re.compile(r'https?://[^\s<>"\')\]]+(?:\([^\s<>"\')\]]*\)[^\s<>"\')\]]*)*')
+
+# Shared session so repeated API calls reuse keep-alive connections
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.3),
+))
+
+
 class LinkedInClient:
     """Client for interacting with LinkedIn's API."""
 
@@ -168,7 +182,7 @@ class LinkedInClient:
             "client_secret": self.client_secret,
         }
 
-        response = requests.post(
+        response = _session.post(
             LINKEDIN_TOKEN_URL,
             data=data,
             headers={"Content-Type": "application/x-www-form-urlencoded"},
@@ -193,7 +207,7 @@ class LinkedInClient:
             "client_secret": self.client_secret,
         }
 
-        response = requests.post(
+        response = _session.post(
             LINKEDIN_TOKEN_URL,
             data=data,
             headers={"Content-Type": "application/x-www-form-urlencoded"},
@@ -216,7 +230,7 @@ class LinkedInClient:
         """
         # First try the OpenID userinfo endpoint (if openid scope was granted)
         try:
-            response = requests.get(
+            response = _session.get(
                 LINKEDIN_USERINFO_URL,
                 headers={
                     "Authorization": f"Bearer {access_token}",
@@ -234,7 +248,7 @@ class LinkedInClient:
 
         # Fallback to /v2/me endpoint for basic profile
         try:
-            response = requests.get(
+            response = _session.get(
                 "https://api.linkedin.com/v2/me",
                 headers={
                     "Authorization": f"Bearer {access_token}",
@@ -282,10 +296,7 @@ class LinkedInClient:
         
         Returns the first http/https URL found, or None if no URL is found.
         """
-        import re
-        # Match http/https URLs
-        url_pattern = r'https?://[^\s<>"\')\]]+(?:\([^\s<>"\')\]]*\)[^\s<>"\')\]]*)*'
-        match = re.search(url_pattern, text)
+        match = _URL_RE.search(text)
         if match:
             url = match.group(0)
             # Clean up trailing punctuation that might have been captured
@@ -315,7 +326,7 @@ class LinkedInClient:
             headers = {
                 "User-Agent": "Mozilla/5.0 (compatible; PodInsights/1.0)"
             }
-            img_response = requests.get(image_url, headers=headers, timeout=30, allow_redirects=True)
+            img_response = _session.get(image_url, headers=headers, timeout=30, allow_redirects=True)
             img_response.raise_for_status()
             image_data = img_response.content
             content_type = img_response.headers.get("Content-Type", "image/jpeg")
@@ -328,7 +339,7 @@ class LinkedInClient:
                 }
             }
             
-            init_response = requests.post(
+            init_response = _session.post(
                 f"{LINKEDIN_IMAGES_URL}?action=initializeUpload",
                 json=init_payload,
                 headers=self._get_api_headers(access_token),
@@ -355,7 +366,7 @@ class LinkedInClient:
                 "Content-Type": content_type,
             }
             
-            upload_response = requests.put(
+            upload_response = _session.put(
                 upload_url,
                 data=image_data,
                 headers=upload_headers,
@@ -408,7 +419,7 @@ class LinkedInClient:
             "isReshareDisabledByAuthor": False,
         }
 
-        response = requests.post(
+        response = _session.post(
             LINKEDIN_POSTS_URL,
             json=payload,
             headers=self._get_api_headers(access_token),
@@ -500,7 +511,7 @@ class LinkedInClient:
             "isReshareDisabledByAuthor": False,
         }
 
-        response = requests.post(
+        response = _session.post(
             LINKEDIN_POSTS_URL,
             json=payload,
             headers=self._get_api_headers(access_token),
@@ -582,7 +593,7 @@ class LinkedInClient:
             "isReshareDisabledByAuthor": False,
         }
 
-        response = requests.post(
+        response = _session.post(
             LINKEDIN_POSTS_URL,
             json=payload,
             headers=self._get_api_headers(access_token),
@@ -716,7 +727,7 @@ class LinkedInClient:
         encoded_urn = quote(post_urn, safe="")
         url = f"{LINKEDIN_POSTS_URL}/{encoded_urn}"
 
-        response = requests.get(
+        response = _session.get(
             url,
             headers=self._get_api_headers(access_token),
             timeout=30,
@@ -739,7 +750,7 @@ class LinkedInClient:
         encoded_urn = quote(post_urn, safe="")
         url = f"{LINKEDIN_POSTS_URL}/{encoded_urn}"
 
-        response = requests.delete(
+        response = _session.delete(
             url,
             headers=self._get_api_headers(access_token),
             timeout=30,
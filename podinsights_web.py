@@ -3,30 +3,51 @@
 from __future__ import annotations
 import os
 import io
+import shutil
+import json
+import hashlib
 import tempfile
 import threading
 import uuid
+from functools import lru_cache
+from operator import itemgetter
 from queue import Queue
-from flask import Flask, request, render_template, redirect, url_for, session, jsonify, send_from_directory
+from concurrent.futures import ThreadPoolExecutor
+from flask import Flask, request, render_template, redirect, url_for, session, jsonify, send_from_directory, g, make_response
 from PIL import Image
 import cloudinary
 import cloudinary.uploader
 import re
 import feedparser
+from feedparser.sanitizer import _sanitize_html as _feedparser_sanitize_html
+import trafilatura
 import requests
-from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 import time
 from html import unescape
-from bs4 import BeautifulSoup
+from bs4 import UnicodeDammit
+from lxml import etree
+from lxml import html as lxml_html
 from urllib.parse import urlparse
 from flasgger import Swagger
 from database import (
     init_db,
     get_episode,
+    get_episodes_by_urls,
     get_episode_by_id,
     save_episode,
     queue_episode,
     update_episode_status,
+    list_unfinished_episodes,
+    item_type_for_url,
+    set_episode_description,
+    list_article_filter_values,
+    load_action_items,
+    get_table_versions,
+    add_tickets,
     delete_episode_by_id,
     delete_episodes_bulk,
     reset_episode_for_reprocess,
@@ -35,7 +56,6 @@ from database import (
     get_feed_by_id,
     delete_feed,
     delete_feeds_bulk,
-    add_ticket,
     list_tickets,
     delete_ticket,
     delete_tickets_bulk,
@@ -46,6 +66,7 @@ from database import (
     update_article,
     delete_article,
     update_feed_metadata,
+    touch_feed_checked,
     add_social_post,
     get_social_post,
     list_social_posts,
@@ -70,10 +91,12 @@ from database import (
     get_pending_schedules_for_social_posts,
     list_scheduled_posts,
     get_pending_scheduled_posts,
+    get_next_scheduled_time,
     update_scheduled_post_status,
     update_scheduled_post_time,
     cancel_scheduled_post,
     delete_scheduled_post,
+    delete_scheduled_posts_by_standalone_id,
     delete_scheduled_posts_bulk,
     clear_pending_scheduled_posts,
     get_scheduled_posts_for_article,
@@ -92,15 +115,18 @@ from database import (
     # Queue redistribution
     redistribute_scheduled_posts,
     # Standalone posts functions (Command Center)
-    add_standalone_post,
+    add_standalone_posts_bulk,
     list_standalone_posts,
     get_standalone_post,
+    get_standalone_posts_bulk,
     update_standalone_post,
     update_standalone_post_image,
     update_social_post_image,
     delete_standalone_post,
     delete_standalone_posts_bulk,
+    delete_all_standalone_posts,
     mark_standalone_post_used,
+    toggle_standalone_post_used,
     # URL sources functions
     add_url_source,
     list_url_sources,
@@ -121,6 +147,9 @@ from database import (
     clear_recent_prompts,
     delete_prompt_by_content,
     delete_prompts_bulk,
+    # LLM generation cache
+    get_generation_cache,
+    set_generation_cache,
 )
 from podinsights import (
     transcribe_audio,
@@ -190,9 +219,10 @@ swagger = Swagger(app, config=swagger_config, template=swagger_template)
 
 # Configure image uploads
 UPLOAD_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static', 'uploads')
-ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'webp'}
+ALLOWED_EXTENSIONS = frozenset({'png', 'jpg', 'jpeg', 'gif', 'webp'})
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
-app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
+MAX_UPLOAD_SIZE = 16 * 1024 * 1024  # 16MB max file size
+app.config['MAX_CONTENT_LENGTH'] = MAX_UPLOAD_SIZE
 
 # Ensure upload directory exists
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
@@ -208,6 +238,76 @@ if os.environ.get('CLOUDINARY_CLOUD_NAME'):
     )
     CLOUDINARY_CONFIGURED = True
 
+# Exact-match cache for LLM post generation (set LLM_CACHE_ENABLED=false to disable)
+LLM_CACHE_ENABLED = os.environ.get('LLM_CACHE_ENABLED', 'true').lower() not in ('0', 'false', 'no')
+LLM_CACHE_TTL = 24 * 60 * 60  # 24 hours
+SOURCE_CACHE_TTL = 60 * 60  # 1 hour for posts generated from saved sources
+
+# generate_posts_from_text only reads the first 5000 characters of its input,
+# so saved sources are trimmed to fit that budget before generation
+GENERATION_INPUT_CHARS = 5000
+SOURCE_TAIL_CHARS = 400  # closing part of a long article kept after the cut
+
+
+def generation_cache_key(*parts) -> str:
+    """Return a stable hash of the inputs that determine an LLM generation."""
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def is_cacheable_generation(generated) -> bool:
+    """Return True if an LLM generation parsed cleanly and may be cached.
+
+    The generators fall back to ``{"raw": ...}`` when the model's JSON can't
+    be parsed; caching that would replay the failure to identical requests.
+    """
+    return (
+        isinstance(generated, dict)
+        and bool(generated)
+        and 'raw' not in generated
+        and 'error' not in generated
+    )
+
+
+# Changes on every start so a deploy with new templates or view code never
+# answers 304 to a tag minted by the previous process
+PAGE_ETAG_BOOT_TOKEN = uuid.uuid4().hex
+
+
+def page_etag(tables: tuple[str, ...], *extra) -> str:
+    """Return an ETag for a list page built only from ``tables``.
+
+    The tag changes whenever any row in those tables changes (tracked by the
+    database's per-table counters), the query string differs or the app
+    restarts.
+    """
+    return generation_cache_key(
+        PAGE_ETAG_BOOT_TOKEN, get_table_versions(tables), request.full_path, *extra,
+    )
+
+
+def not_modified(etag: str):
+    """Return an empty 304 response for a client already holding ``etag``."""
+    resp = make_response('', 304)
+    resp.set_etag(etag)
+    return resp
+
+
+def revalidated_response(body: str, etag: str):
+    """Wrap a rendered page so browsers revalidate it with ``If-None-Match``."""
+    resp = make_response(body)
+    resp.set_etag(etag)
+    resp.cache_control.private = True
+    resp.cache_control.no_cache = True
+    return resp
+
+
+@app.before_request
+def _cache_host_url():
+    """Resolve the absolute URL prefix once per request for URL building."""
+    g.host_url = request.host_url
+
+
 def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
@@ -259,9 +359,6 @@ def save_stock_image_to_library(image_url: str, direct_save: bool = False) -> st
     Otherwise downloads and re-uploads to Cloudinary or local storage.
     Returns the saved image URL.
     """
-    import requests as req
-    import re
-    
     # Check if this image URL is already in the library
     existing = list_uploaded_images()
     for img in existing:
@@ -301,7 +398,7 @@ def save_stock_image_to_library(image_url: str, direct_save: bool = False) -> st
         return image_url
     
     # For non-stock URLs, download and re-upload
-    response = req.get(image_url, timeout=30, stream=True)
+    response = _source_http.get(image_url, headers={'Accept': '*/*'}, timeout=30)
     response.raise_for_status()
     
     # Get content type to determine extension
@@ -380,6 +477,103 @@ init_db()
 # Background processing queue used to process episodes without blocking the web request
 task_queue: Queue = Queue()
 
+# Episode audio is streamed to disk in 1MB chunks (files are often 50-200MB)
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Request threads for the waitress server used when not in debug mode
+WEB_SERVER_THREADS = int(os.environ.get('PODINSIGHTS_WEB_THREADS', '16'))
+
+# Number of episodes downloaded and processed concurrently
+EPISODE_WORKERS = max(1, int(os.environ.get('PODINSIGHTS_EPISODE_WORKERS', '2')))
+
+# Local whisper models saturate the CPU/GPU, so only this many transcriptions
+# run at once; downloads and LLM calls in the other workers still overlap them
+TRANSCRIBE_CONCURRENCY = max(1, int(os.environ.get('PODINSIGHTS_TRANSCRIBE_CONCURRENCY', '1')))
+_transcribe_slots = threading.BoundedSemaphore(TRANSCRIBE_CONCURRENCY)
+
+# Large episodes are fetched as parallel byte ranges when the host supports it
+DOWNLOAD_RANGE_PARTS = 8
+DOWNLOAD_RANGE_MIN_SIZE = 8 * 1024 * 1024  # below this a single stream is fine
+DOWNLOAD_TIMEOUT = (10, 60)
+
+# Shared HTTP session for episode audio; pool sized for the ranged parts of
+# every episode worker downloading at once
+_audio_http = requests.Session()
+_audio_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=DOWNLOAD_RANGE_PARTS * EPISODE_WORKERS,
+    max_retries=Retry(total=2, backoff_factor=0.5),
+)
+_audio_http.mount('http://', _audio_adapter)
+_audio_http.mount('https://', _audio_adapter)
+
+
+def _download_range(url: str, start: int, end: int, fd: int) -> None:
+    """Fetch bytes ``start``-``end`` of ``url`` into ``fd`` at the same offset."""
+    headers = {'Range': f'bytes={start}-{end}'}
+    with _audio_http.get(url, headers=headers, stream=True, timeout=DOWNLOAD_TIMEOUT) as r:
+        r.raise_for_status()
+        if r.status_code != 206:
+            raise ValueError(f"Range request not honoured (HTTP {r.status_code})")
+        offset = start
+        for chunk in r.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+            os.pwrite(fd, chunk, offset)
+            offset += len(chunk)
+    if offset != end + 1:
+        raise ValueError(f"Short read for range {start}-{end}")
+
+
+def _download_stream(url: str, path: str) -> None:
+    """Download ``url`` to ``path`` over a single streamed connection."""
+    with _audio_http.get(url, stream=True, timeout=DOWNLOAD_TIMEOUT) as r:
+        r.raise_for_status()
+        # Copy straight from the socket to the file without per-chunk bytes objects
+        r.raw.decode_content = True
+        with open(path, "wb") as f:
+            shutil.copyfileobj(r.raw, f, length=DOWNLOAD_CHUNK_SIZE)
+
+
+def download_audio(url: str, path: str) -> None:
+    """Download episode audio, using parallel range requests when supported."""
+    try:
+        head = _audio_http.head(url, allow_redirects=True, timeout=DOWNLOAD_TIMEOUT)
+        size = int(head.headers.get('Content-Length', 0))
+        ranged = (
+            head.ok
+            and head.headers.get('Accept-Ranges', '').lower() == 'bytes'
+            and size >= DOWNLOAD_RANGE_MIN_SIZE
+            and hasattr(os, 'pwrite')
+        )
+    except (requests.RequestException, ValueError):
+        ranged = False
+    if not ranged:
+        _download_stream(url, path)
+        return
+
+    # Ranges go to the final URL so tracking redirects are followed only once
+    target = head.url
+    part = -(-size // DOWNLOAD_RANGE_PARTS)
+    ranges = [(start, min(start + part, size) - 1) for start in range(0, size, part)]
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.ftruncate(fd, size)
+        with ThreadPoolExecutor(max_workers=len(ranges)) as pool:
+            list(pool.map(lambda r: _download_range(target, r[0], r[1], fd), ranges))
+    except Exception:
+        app.logger.warning("Ranged download failed for %s, retrying as a stream", url, exc_info=True)
+        os.close(fd)
+        _download_stream(url, path)
+        return
+    os.close(fd)
+
+
+def analyze_transcript(transcript: str) -> tuple[str, list[str]]:
+    """Summarize and extract action items, running both LLM calls at once."""
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        summary = executor.submit(summarize_text, transcript)
+        actions = executor.submit(extract_action_items, transcript)
+        return summary.result(), actions.result()
+
 
 def worker() -> None:
     """Background thread processing queued episodes."""
@@ -396,17 +590,13 @@ def worker() -> None:
             update_episode_status(url, "processing")
             with tempfile.TemporaryDirectory() as tmpdir:
                 audio_path = os.path.join(tmpdir, "episode.mp3")
-                with requests.get(url, stream=True) as r:
-                    r.raise_for_status()
-                    with open(audio_path, "wb") as f:
-                        for chunk in r.iter_content(chunk_size=8192):
-                            f.write(chunk)
-                transcript = transcribe_audio(audio_path)
-                summary = summarize_text(transcript)
-                actions = extract_action_items(transcript)
+                download_audio(url, audio_path)
+                with _transcribe_slots:
+                    transcript = transcribe_audio(audio_path)
+                summary, actions = analyze_transcript(transcript)
                 out_path = os.path.join(tmpdir, "results.json")
                 write_results_json(transcript, summary, actions, out_path)
-                save_episode(url, title, transcript, summary, actions, feed_id, published)
+                save_episode(url, title, transcript, summary, actions, feed_id, published, item_type="audio")
         except Exception:
             app.logger.exception("Failed to process episode %s", url)
             update_episode_status(url, "error")
@@ -418,136 +608,387 @@ def worker() -> None:
 # (app.debug is False at import time, so we can't check it here)
 
 
+_LINE_BREAK_TAG_RE = re.compile(r"<br\s*/?>|</p\s*>", re.I)
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+")
+# Entries memoized by the feed text helpers below. Their keys and values can
+# be whole content:encoded bodies, so this covers a few feed pages, not more.
+TEXT_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=TEXT_CACHE_SIZE)
 def strip_html(text: str) -> str:
     """Return plain text with HTML tags removed."""
     if not text:
         return ""
-    # replace common HTML tags with line breaks then strip everything else
-    text = re.sub(r"<br\s*/?>", "\n", text, flags=re.I)
-    text = re.sub(r"</p\s*>", "\n", text, flags=re.I)
-    text = re.sub(r"<[^>]+>", "", text)
-    return unescape(text).strip()
-
-
+    if "<" not in text and "&" not in text:
+        # Already plain text: no tags to drop and no entities to decode
+        return text.strip()
+    try:
+        root = lxml_html.fragment_fromstring(text, create_parent='div', parser=_HTML_PARSER)
+    except (etree.LxmlError, ValueError):
+        # replace line-breaking tags with newlines then strip everything else
+        text = _LINE_BREAK_TAG_RE.sub("\n", text)
+        text = _HTML_TAG_RE.sub("", text)
+        return unescape(text).strip()
+    # Scripts and styles aren't readable text; drop_tree keeps what follows them
+    for el in list(root.iter('script', 'style')):
+        el.drop_tree()
+    # Keep the line breaks that <br> and </p> imply
+    for el in root.iter('br', 'p'):
+        el.tail = "\n" + (el.tail or "")
+    return root.text_content().strip()
+
+
+@lru_cache(maxsize=TEXT_CACHE_SIZE)
 def make_short_description(text: str, limit: int = 200) -> str:
     """Return a short preview from the provided text."""
     if not text:
         return ""
     text = text.strip()
-    # Use the first couple of sentences as a human friendly snippet
-    sentences = re.split(r"(?<=[.!?])\s+", text)
-    short = " ".join(sentences[:2])
+    # Use the first couple of sentences as a human friendly snippet; only the
+    # first two sentence breaks are needed, so stop scanning once they're found
+    breaks = _SENTENCE_END_RE.finditer(text)
+    first = next(breaks, None)
+    if first is None:
+        short = text
+    else:
+        second = next(breaks, None)
+        rest = text[first.end():second.start()] if second else text[first.end():]
+        short = text[:first.start()] + " " + rest
     if len(short) > limit:
         short = short[:limit].rstrip() + "..."
     return short
 
 
+@lru_cache(maxsize=TEXT_CACHE_SIZE)
+def sanitize_feed_html(html: str) -> str:
+    """Return feed-supplied HTML made safe to render unescaped.
+
+    Uses the same sanitizer feedparser applies during parsing; it is not part
+    of feedparser's public API, so requirements.txt pins feedparser to 6.0.x.
+    """
+    if not html:
+        return ""
+    return _feedparser_sanitize_html(html, 'utf-8', 'text/html')
+
+
+# Shared HTTP session for fetching URL sources; keeps connections alive per host
+_source_http = requests.Session()
+_source_http.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+})
+_source_adapter = HTTPAdapter(pool_connections=32, pool_maxsize=8, max_retries=Retry(total=2, backoff_factor=0.5))
+_source_http.mount('http://', _source_adapter)
+_source_http.mount('https://', _source_adapter)
+
+
+def fetch_source_html(url: str, timeout: tuple[int, int] = (5, 15)) -> tuple[bytes, str | None] | None:
+    """Download a page over the pooled session.
+
+    Returns ``(raw_bytes, charset)`` or None on failure. ``charset`` is the
+    one named in the Content-Type header, or None when the server gave none.
+    """
+    try:
+        resp = _source_http.get(url, timeout=timeout)
+    except requests.RequestException as e:
+        app.logger.warning("Failed to fetch %s: %s", url, e)
+        return None
+    if not resp.ok:
+        app.logger.warning("Failed to fetch %s: HTTP %d", url, resp.status_code)
+        return None
+    if not resp.content:
+        return None
+    # requests assumes ISO-8859-1 for text/* without a charset, so only pass
+    # the encoding on when the header actually names one
+    content_type = resp.headers.get('content-type', '').lower()
+    charset = resp.encoding if 'charset=' in content_type else None
+    return resp.content, charset
+
+
+@lru_cache(maxsize=16)
+def _html_parser_for(encoding: str | None):
+    """Return an HTML parser that decodes input as ``encoding``.
+
+    Falls back to the shared auto-detecting parser when no (or an unknown)
+    encoding is given.
+    """
+    if encoding:
+        try:
+            return lxml_html.HTMLParser(encoding=encoding, collect_ids=False, huge_tree=False)
+        except LookupError:
+            pass
+    return _HTML_PARSER
+
+
+_HTML_PARSER = lxml_html.HTMLParser(collect_ids=False, huge_tree=False)
+
+
+def _extract_head_meta(tree) -> tuple[str, str, str | None]:
+    """Return ``(title, description, og_image)`` from a parsed page's ``<head>``.
+
+    Walks the head once, preferring og:title/og:description over ``<title>``
+    and the plain meta description, and stops as soon as all Open Graph
+    fields have been seen.
+    """
+    head = tree.getroottree().getroot().find('head')
+    if head is None:
+        return "", "", None
+
+    title = og_title = og_desc = meta_desc = og_image = None
+    for el in head.iterchildren():
+        if el.tag == 'title':
+            if title is None and el.text:
+                title = el.text.strip()
+        elif el.tag == 'meta':
+            content = el.get('content')
+            if not content:
+                continue
+            prop = (el.get('property') or '').lower()
+            if prop == 'og:title':
+                og_title = og_title or content
+            elif prop == 'og:description':
+                og_desc = og_desc or content
+            elif prop == 'og:image':
+                og_image = og_image or content
+            elif (el.get('name') or '').lower() == 'description':
+                meta_desc = meta_desc or content
+        if og_title and og_desc and og_image:
+            break
+
+    return og_title or title or "", og_desc or meta_desc or "", og_image
+
+
+# Extraction results keyed by the SHA-1 of the page (and its charset) so the
+# HTML itself is neither kept alive nor compared on lookups
+_extraction_cache: dict[tuple[str, str | None], tuple[str, str, str, str | None]] = {}
+_extraction_cache_lock = threading.Lock()
+EXTRACTION_CACHE_MAX_ENTRIES = 256
+
+
+def _extract_page(html: bytes, encoding: str | None) -> tuple[str, str, str, str | None]:
+    """Return ``(title, description, body_content, og_image)`` for a page.
+
+    The HTML is parsed once and the tree is shared by the head-meta reader
+    and trafilatura.
+    """
+    try:
+        # A charset from the HTTP header wins over libxml2's Latin-1 guess for
+        # pages without <meta charset>
+        tree = lxml_html.fromstring(html, parser=_html_parser_for(encoding))
+    except (etree.ParserError, ValueError):
+        return "", "", "", None
+
+    # Read metadata before extract(), which prunes nodes from the tree. The
+    # <head> tags cover almost every page; trafilatura's full metadata pass
+    # (authors, dates, JSON-LD, ...) only runs when they are missing.
+    title, description, og_image = _extract_head_meta(tree)
+    if not title or not description:
+        metadata = trafilatura.extract_metadata(tree)
+        if metadata:
+            title = title or metadata.title or ""
+            description = description or metadata.description or ""
+            og_image = og_image or metadata.image
+
+    body_content = trafilatura.extract(
+        tree,
+        include_comments=False,
+        include_tables=True,
+        favor_precision=True,
+    ) or ""
+
+    return title, description, body_content, og_image
+
+
+def extract_source_content(downloaded, encoding: str | None = None) -> tuple[str, str, str, str | None]:
+    """Extract title, description, body and og:image from downloaded HTML.
+
+    ``encoding`` is the charset the server declared for ``downloaded`` bytes;
+    text input is re-encoded as UTF-8 and parsed as such.
+    """
+    if isinstance(downloaded, str):
+        raw, encoding = downloaded.encode('utf-8'), 'utf-8'
+    else:
+        raw = downloaded
+    # Re-extracting an unchanged page skips all of it; a changed page hashes
+    # differently and gets a fresh extraction
+    key = (hashlib.sha1(raw).hexdigest(), encoding)
+    with _extraction_cache_lock:
+        cached = _extraction_cache.get(key)
+    if cached is not None:
+        return cached
+    result = _extract_page(raw, encoding)
+    with _extraction_cache_lock:
+        _extraction_cache[key] = result
+        while len(_extraction_cache) > EXTRACTION_CACHE_MAX_ENTRIES:
+            # Dicts keep insertion order, so the first key is the oldest
+            del _extraction_cache[next(iter(_extraction_cache))]
+    return result
+
+
+# URLs with these extensions are media files, never articles
+MEDIA_EXTENSIONS = (
+    '.mp3', '.mp4', '.m4a', '.wav', '.ogg', '.webm', '.avi', '.mov',
+    '.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg', '.pdf', '.zip'
+)
+# Class/id fragments of ad, tracking and chrome elements stripped before extraction
+_AD_CLASS_RE = re.compile(
+    r'(ad|ads|advert|banner|sidebar|comment|share|social|related|recommend|newsletter|popup|modal|cookie)',
+    re.I,
+)
+# Runs of spaces/tabs or of 3+ newlines, collapsed together in one pass
+_WHITESPACE_RUN_RE = re.compile(r'[ \t]+|\n{3,}')
+
+
+def _collapse_whitespace_run(match: re.Match) -> str:
+    return '\n\n' if match.group()[0] == '\n' else ' '
+
+
+# Page chrome and form elements that never hold article text
+_UNWANTED_TAGS = (
+    'script', 'style', 'nav', 'header', 'footer', 'aside', 'iframe', 'noscript',
+    'form', 'button', 'input', 'select', 'textarea',
+)
+# Block elements whose text makes up the article body
+_TEXT_BLOCK_TAGS = ('p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'li', 'blockquote', 'pre', 'code')
+
+
+def _xpath_class(name: str) -> str:
+    """Return an XPath predicate matching elements with CSS class ``name``."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# Likely main-content containers, in order of preference
+_MAIN_CONTENT_XPATHS = [
+    etree.XPath(f".//*[{expr}]")
+    for expr in (
+        "@role='main'",
+        _xpath_class('article-content'),
+        _xpath_class('post-content'),
+        _xpath_class('entry-content'),
+        _xpath_class('content'),
+        "@id='content'",
+        _xpath_class('story-body'),
+        _xpath_class('article-body'),
+        _xpath_class('post-body'),
+        "self::main",
+    )
+]
+_CLASS_OR_ID_XPATH = etree.XPath("//body//*[@class or @id]")
+MAX_HTML_BYTES = 5 * 1024 * 1024  # article pages are truncated beyond this size
+_ARTICLE_PARSER = lxml_html.HTMLParser(remove_comments=True, collect_ids=False)
+
+
+def _joined_text(el, separator: str) -> str:
+    """Join an element's non-blank text nodes, stripped, with ``separator``."""
+    return separator.join(t.strip() for t in el.itertext() if t.strip())
+
+
+def _extract_main_text(html: bytes, encoding: str | None = None) -> str:
+    """Pull readable article text out of a page without trafilatura.
+
+    ``encoding`` is the charset the server declared, if any; it is tried
+    first so character-set sniffing only runs for undeclared pages.
+    """
+    # Decode the way BeautifulSoup would, then let lxml build the tree
+    markup = UnicodeDammit(
+        html,
+        known_definite_encodings=[encoding] if encoding else [],
+        is_html=True,
+    ).unicode_markup
+    try:
+        root = lxml_html.fromstring(markup, parser=_ARTICLE_PARSER)
+    except ValueError:
+        # Strings carrying an XML encoding declaration must be parsed as bytes
+        root = lxml_html.fromstring(html, parser=_ARTICLE_PARSER)
+
+    # Remove unwanted elements in a single C-level pass, keeping their tails
+    etree.strip_elements(root, *_UNWANTED_TAGS, with_tail=False)
+
+    # Remove common ad/tracking elements by class or id patterns, in one pass
+    for element in _CLASS_OR_ID_XPATH(root):
+        if _AD_CLASS_RE.search(f"{element.get('class', '')} {element.get('id', '')}"):
+            element.drop_tree()
+
+    # Priority 1: Look for article tag
+    article_content = root.find('.//article')
+
+    # Priority 2: Look for main content divs
+    if article_content is None:
+        for xpath in _MAIN_CONTENT_XPATHS:
+            found = xpath(root)
+            if found:
+                article_content = found[0]
+                break
+
+    # Priority 3: Use body as fallback
+    if article_content is None:
+        article_content = root.find('body')
+        if article_content is None:
+            article_content = root
+
+    # Extract text from paragraphs for cleaner output
+    paragraphs = list(article_content.iterdescendants(*_TEXT_BLOCK_TAGS))
+    if paragraphs:
+        text_parts = []
+        for p in paragraphs:
+            text = _joined_text(p, ' ')
+            if text and len(text) > 20:  # Filter out short fragments
+                text_parts.append(text)
+        content = '\n\n'.join(text_parts)
+    else:
+        # Fallback: get all text
+        content = _joined_text(article_content, '\n')
+
+    # Clean up whitespace
+    content = _WHITESPACE_RUN_RE.sub(_collapse_whitespace_run, content)
+    return content.strip()
+
+
 def fetch_article_content(url: str, timeout: int = 15) -> str:
     """Fetch and extract the main content from an article URL.
     
-    Uses trafilatura for robust article extraction, with BeautifulSoup as fallback.
+    Uses trafilatura for robust article extraction, with a plain lxml pass as fallback.
     Returns extracted text or empty string on failure.
     """
-    import trafilatura
-    
     # Skip non-HTML URLs (audio, video, images, etc.)
-    media_extensions = (
-        '.mp3', '.mp4', '.m4a', '.wav', '.ogg', '.webm', '.avi', '.mov',
-        '.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg', '.pdf', '.zip'
-    )
     url_lower = url.lower().split('?')[0]  # Remove query params for extension check
-    if url_lower.endswith(media_extensions):
+    if url_lower.endswith(MEDIA_EXTENSIONS):
         app.logger.info("Skipping media URL (not an article): %s", url)
         return ""
     
     try:
-        # Try trafilatura first - it's specifically designed for article extraction
-        downloaded = trafilatura.fetch_url(url)
-        
-        if downloaded:
-            content = trafilatura.extract(
-                downloaded,
-                include_comments=False,
-                include_tables=True,
-                favor_precision=True,
-            )
-            if content and len(content) > 200:
-                app.logger.info("Extracted %d chars using trafilatura from: %s", len(content), url)
-                return content
-        
-        # Fallback to BeautifulSoup for non-article pages or if trafilatura fails
-        app.logger.info("Trafilatura extraction insufficient, falling back to BeautifulSoup for: %s", url)
-        
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-        }
-        
-        resp = requests.get(url, headers=headers, timeout=timeout)
-        resp.raise_for_status()
-        
-        # Check content type - only process HTML
-        content_type = resp.headers.get('content-type', '').lower()
-        if 'text/html' not in content_type and 'application/xhtml' not in content_type:
-            return ""
-        
-        soup = BeautifulSoup(resp.content, 'lxml')
-        
-        # Remove unwanted elements
-        for element in soup.find_all(['script', 'style', 'nav', 'header', 'footer', 
-                                       'aside', 'iframe', 'noscript', 'form',
-                                       'button', 'input', 'select', 'textarea']):
-            element.decompose()
-        
-        # Remove common ad/tracking elements by class or id patterns
-        for element in soup.find_all(class_=re.compile(r'(ad|ads|advert|banner|sidebar|comment|share|social|related|recommend|newsletter|popup|modal|cookie)', re.I)):
-            element.decompose()
-        for element in soup.find_all(id=re.compile(r'(ad|ads|advert|banner|sidebar|comment|share|social|related|recommend|newsletter|popup|modal|cookie)', re.I)):
-            element.decompose()
-        
-        # Try to find the main content area
-        article_content = None
-        
-        # Priority 1: Look for article tag
-        article = soup.find('article')
-        if article:
-            article_content = article
-        
-        # Priority 2: Look for main content divs
-        if not article_content:
-            for selector in ['[role="main"]', '.article-content', '.post-content', 
-                            '.entry-content', '.content', '#content', '.story-body',
-                            '.article-body', '.post-body', 'main']:
-                found = soup.select_one(selector)
-                if found:
-                    article_content = found
-                    break
-        
-        # Priority 3: Use body as fallback
-        if not article_content:
-            article_content = soup.find('body') or soup
-        
-        # Extract text from paragraphs for cleaner output
-        paragraphs = article_content.find_all(['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'li', 'blockquote', 'pre', 'code'])
-        
-        if paragraphs:
-            text_parts = []
-            for p in paragraphs:
-                text = p.get_text(separator=' ', strip=True)
-                if text and len(text) > 20:  # Filter out short fragments
-                    text_parts.append(text)
-            content = '\n\n'.join(text_parts)
-        else:
-            # Fallback: get all text
-            content = article_content.get_text(separator='\n', strip=True)
+        # Download once over the pooled session; both extractors share the page
+        headers = {'Accept-Language': 'en-US,en;q=0.5'}
+        with _source_http.get(url, headers=headers, timeout=timeout, stream=True) as resp:
+            resp.raise_for_status()
+            
+            # Check content type before downloading the body - only process HTML
+            content_type = resp.headers.get('content-type', '').lower()
+            if 'text/html' not in content_type and 'application/xhtml' not in content_type:
+                return ""
+            
+            # requests assumes ISO-8859-1 for text/* without a charset, so
+            # only trust the encoding when the header actually names one
+            encoding = resp.encoding if 'charset=' in content_type else None
+            resp.raw.decode_content = True
+            html = resp.raw.read(MAX_HTML_BYTES)
         
-        # Clean up whitespace
-        content = re.sub(r'\n{3,}', '\n\n', content)
-        content = re.sub(r'[ \t]+', ' ', content)
-        content = content.strip()
+        # Try trafilatura first - it's specifically designed for article extraction
+        content = trafilatura.extract(
+            html,
+            include_comments=False,
+            include_tables=True,
+            favor_precision=True,
+        )
+        if content and len(content) > 200:
+            app.logger.info("Extracted %d chars using trafilatura from: %s", len(content), url)
+            return content
         
-        return content
+        # Fall back to our own extraction for non-article pages or if trafilatura fails
+        app.logger.info("Trafilatura extraction insufficient, falling back to lxml for: %s", url)
+        return _extract_main_text(html, encoding)
         
     except requests.exceptions.Timeout:
         app.logger.warning("Timeout fetching article: %s", url)
@@ -559,19 +1000,79 @@ def fetch_article_content(url: str, timeout: int = 15) -> str:
         app.logger.exception("Error extracting content from %s: %s", url, str(e))
         return ""
 
+# JIRA credentials are read once at startup, like the Cloudinary settings
+JIRA_BASE_URL = os.environ.get("JIRA_BASE_URL")
+JIRA_EMAIL = os.environ.get("JIRA_EMAIL")
+JIRA_API_TOKEN = os.environ.get("JIRA_API_TOKEN")
+JIRA_PROJECT_KEY = os.environ.get("JIRA_PROJECT_KEY")
+JIRA_CONFIGURED = all([JIRA_BASE_URL, JIRA_EMAIL, JIRA_API_TOKEN])
+
+JIRA_FETCH_WORKERS = 16  # concurrent JIRA lookups when rendering ticket lists
+JIRA_TIMEOUT = (3.05, 10)  # (connect, read) seconds for every JIRA request
+
+# Shared keep-alive session for JIRA; retries honour Retry-After on rate limits
+_jira_session = requests.Session()
+_jira_session.mount('https://', HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 502, 503, 504],
+        respect_retry_after_header=True,
+    ),
+))
+# Basic auth with an API token, sent on every request made through the session
+_jira_session.auth = (JIRA_EMAIL, JIRA_API_TOKEN)
+
+# Short-lived cache of JIRA lookups keyed by (kind, issue_key)
+_jira_cache: dict[tuple[str, str], tuple[float, object]] = {}
+_jira_cache_lock = threading.Lock()
+JIRA_CACHE_SECONDS = 60
+JIRA_CACHE_MAX_ENTRIES = 2048
+_jira_invalidations = 0  # bumped whenever a ticket changes through this app
+
+
+def _jira_cache_get(kind: str, issue_key: str):
+    """Return a cached JIRA lookup younger than ``JIRA_CACHE_SECONDS``, or None."""
+    with _jira_cache_lock:
+        entry = _jira_cache.get((kind, issue_key))
+    if entry and time.time() - entry[0] < JIRA_CACHE_SECONDS:
+        return entry[1]
+    return None
+
+
+def _jira_cache_set(kind: str, issue_key: str, value) -> None:
+    now = time.time()
+    with _jira_cache_lock:
+        # Re-insert so dict order stays oldest-first for eviction
+        _jira_cache.pop((kind, issue_key), None)
+        _jira_cache[(kind, issue_key)] = (now, value)
+        if len(_jira_cache) > JIRA_CACHE_MAX_ENTRIES:
+            # Drop expired lookups, then the oldest ones if still over the cap
+            for key in [k for k, (ts, _) in _jira_cache.items() if now - ts >= JIRA_CACHE_SECONDS]:
+                del _jira_cache[key]
+            while len(_jira_cache) > JIRA_CACHE_MAX_ENTRIES:
+                del _jira_cache[next(iter(_jira_cache))]
+
+
+def invalidate_jira_cache(issue_key: str) -> None:
+    """Drop cached status and transitions for an issue after it changes."""
+    global _jira_invalidations
+    with _jira_cache_lock:
+        _jira_invalidations += 1
+        _jira_cache.pop(("details", issue_key), None)
+
+
 def create_jira_issue(summary: str, description: str) -> dict:
     """Create a JIRA issue using credentials from environment variables."""
-    base = os.environ.get("JIRA_BASE_URL")
-    email = os.environ.get("JIRA_EMAIL")
-    token = os.environ.get("JIRA_API_TOKEN")
-    project = os.environ.get("JIRA_PROJECT_KEY")
-    if not all([base, email, token, project]):
+    if not (JIRA_CONFIGURED and JIRA_PROJECT_KEY):
         raise RuntimeError("JIRA configuration is missing")
 
-    url = f"{base}/rest/api/3/issue"
+    url = f"{JIRA_BASE_URL}/rest/api/3/issue"
     data = {
         "fields": {
-            "project": {"key": project},
+            "project": {"key": JIRA_PROJECT_KEY},
             "summary": summary,
             "description": {
                 "type": "doc",
@@ -591,125 +1092,351 @@ def create_jira_issue(summary: str, description: str) -> dict:
             "issuetype": {"name": "Task"},
         }
     }
-    # Use basic auth with an API token
-    resp = requests.post(url, json=data, auth=(email, token))
+    resp = _jira_session.post(url, json=data, timeout=JIRA_TIMEOUT)
     resp.raise_for_status()
     return resp.json()
 
 
-def get_jira_issue_status(issue_key: str) -> str:
-    """Return the status name for a JIRA issue."""
-    base = os.environ.get("JIRA_BASE_URL")
-    email = os.environ.get("JIRA_EMAIL")
-    token = os.environ.get("JIRA_API_TOKEN")
-    if not all([base, email, token, issue_key]):
-        return ""
-    try:
-        # Fetch the issue data from JIRA
-        url = f"{base}/rest/api/3/issue/{issue_key}"
-        resp = requests.get(url, auth=(email, token))
-        resp.raise_for_status()
-        data = resp.json()
-        return data.get("fields", {}).get("status", {}).get("name", "")
-    except Exception:  # pragma: no cover - external call
-        app.logger.exception("Failed to fetch status for %s", issue_key)
-        return ""
-
+def get_jira_issue_details(issue_key: str) -> tuple[str, list[dict]]:
+    """Return the status name and available transitions for a JIRA issue.
 
-def get_jira_issue_transitions(issue_key: str) -> list[dict]:
-    """Return available transitions for a JIRA issue."""
-    base = os.environ.get("JIRA_BASE_URL")
-    email = os.environ.get("JIRA_EMAIL")
-    token = os.environ.get("JIRA_API_TOKEN")
-    if not all([base, email, token, issue_key]):
-        return []
+    Both come back from a single request by expanding transitions on the
+    issue itself, and the pair is cached for ``JIRA_CACHE_SECONDS``.
+    """
+    if not (JIRA_CONFIGURED and issue_key):
+        return "", []
+    cached = _jira_cache_get("details", issue_key)
+    if cached is not None:
+        return cached
     try:
-        # Fetch transitions that allow moving the issue between states
-        url = f"{base}/rest/api/3/issue/{issue_key}/transitions"
-        resp = requests.get(url, auth=(email, token))
+        url = f"{JIRA_BASE_URL}/rest/api/3/issue/{issue_key}"
+        params = {"fields": "status", "expand": "transitions"}
+        resp = _jira_session.get(url, params=params, timeout=JIRA_TIMEOUT)
         resp.raise_for_status()
         data = resp.json()
-        return [
+        status = data.get("fields", {}).get("status", {}).get("name", "")
+        transitions = [
             {"id": t.get("id"), "name": t.get("name")}
             for t in data.get("transitions", [])
         ]
+        _jira_cache_set("details", issue_key, (status, transitions))
+        return status, transitions
     except Exception:  # pragma: no cover - external call
-        app.logger.exception("Failed to fetch transitions for %s", issue_key)
-        return []
+        app.logger.exception("Failed to fetch details for %s", issue_key)
+        return "", []
 
 
 def transition_jira_issue(issue_key: str, transition_id: str) -> None:
     """Move a JIRA issue to a new status via transition id."""
-    base = os.environ.get("JIRA_BASE_URL")
-    email = os.environ.get("JIRA_EMAIL")
-    token = os.environ.get("JIRA_API_TOKEN")
-    if not all([base, email, token, issue_key, transition_id]):
+    if not (JIRA_CONFIGURED and issue_key and transition_id):
         return
     try:
         # Perform the transition request
-        url = f"{base}/rest/api/3/issue/{issue_key}/transitions"
+        url = f"{JIRA_BASE_URL}/rest/api/3/issue/{issue_key}/transitions"
         data = {"transition": {"id": transition_id}}
-        resp = requests.post(url, json=data, auth=(email, token))
+        resp = _jira_session.post(url, json=data, timeout=JIRA_TIMEOUT)
         resp.raise_for_status()
+        invalidate_jira_cache(issue_key)
     except Exception:  # pragma: no cover - external call
         app.logger.exception(
             "Failed to transition %s using id %s", issue_key, transition_id
         )
 
+def attach_jira_details(tickets: list[dict]) -> None:
+    """Fill in ``status`` and ``transitions`` for each ticket from JIRA.
+
+    Each ticket needs one HTTPS call, and the calls run concurrently.
+    """
+    if not tickets:
+        return
+    if not JIRA_CONFIGURED:
+        for t in tickets:
+            t["status"] = ""
+            t["transitions"] = []
+        return
+    with ThreadPoolExecutor(max_workers=JIRA_FETCH_WORKERS) as executor:
+        details = {
+            t["ticket_key"]: executor.submit(get_jira_issue_details, t["ticket_key"])
+            for t in tickets
+        }
+        for t in tickets:
+            t["status"], t["transitions"] = details[t["ticket_key"]].result()
+
 # Templates are stored in the ``templates`` directory
 
-def refresh_feed_metadata(feed_id: int, feed_url: str) -> dict:
-    """Fetch feed and update cached metadata. Returns the metadata dict."""
+# Parsed feeds kept in memory with their ETag/Last-Modified validators
+_feed_cache: dict[str, dict] = {}
+_feed_cache_lock = threading.Lock()
+FEED_CACHE_SECONDS = 300  # serve repeat page loads without re-requesting the feed
+FEED_REFRESH_WORKERS = int(os.environ.get('PODINSIGHTS_REFRESH_WORKERS', '8'))
+
+
+def parse_feed(url: str, etag: str | None = None, modified: str | None = None):
+    """Parse an RSS feed, reusing the last result when it hasn't changed.
+
+    Results younger than ``FEED_CACHE_SECONDS`` come straight from memory;
+    older ones are re-requested with a conditional GET. Returns ``None`` only
+    when the server answers 304 for the given validators and nothing is
+    cached in memory (e.g. after a restart).
+    """
+    with _feed_cache_lock:
+        cached = _feed_cache.get(url)
+    if cached:
+        if time.time() - cached['fetched_at'] < FEED_CACHE_SECONDS:
+            return cached['data']
+        etag, modified = cached['etag'], cached['modified']
+
+    # Entries are sanitized lazily (only the descriptions actually displayed),
+    # which skips a pure-Python pass over every entry of the feed. Relative
+    # URIs are still resolved here since only the parser knows each entry's
+    # base, and feed.html renders descriptions with their links and images.
+    feed_data = feedparser.parse(
+        url,
+        etag=etag,
+        modified=modified,
+        sanitize_html=False,
+    )
+    if feed_data.get('status') == 304:
+        if not cached:
+            return None
+        with _feed_cache_lock:
+            cached['fetched_at'] = time.time()
+        return cached['data']
+
+    if feed_data.entries:
+        with _feed_cache_lock:
+            _feed_cache[url] = {
+                'data': feed_data,
+                'etag': feed_data.get('etag'),
+                'modified': feed_data.get('modified'),
+                'fetched_at': time.time(),
+            }
+    return feed_data
+
+
+def get_feed_entries(feed_url: str) -> dict[str, dict]:
+    """Return a feed's items keyed by episode URL, in feed order.
+
+    Audio items are keyed by their enclosure URL and text items by their link,
+    matching the URLs episodes are stored under. Each value holds the raw
+    ``entry``, its ``item_type`` and a pre-cleaned ``clean_description``. The
+    index is built once per fetched feed and shared by every route that needs
+    to look an entry up.
+    """
+    feed_data = parse_feed(feed_url)
+    if feed_data is None:
+        return {}
+    with _feed_cache_lock:
+        cached = _feed_cache.get(feed_url)
+        if cached and cached['data'] is feed_data and 'entries' in cached:
+            return cached['entries']
+
+    entries: dict[str, dict] = {}
+    for entry in feed_data.entries:
+        if entry.get('enclosures'):
+            url = entry.enclosures[0].href
+            item_type = 'audio'
+        else:
+            # Text feed - use link as unique identifier
+            url = entry.get('link', entry.get('id', ''))
+            if not url:
+                continue
+            # Some feeds use the link for the audio file instead of an enclosure
+            item_type = item_type_for_url(url)
+        if url in entries:
+            continue
+        # Prefer the summary element but fall back to description
+        desc = entry.get('summary') or entry.get('description', '')
+        entries[url] = {
+            'entry': entry,
+            'item_type': item_type,
+            'description': desc,
+            'clean_description': strip_html(desc),
+        }
+
+    with _feed_cache_lock:
+        cached = _feed_cache.get(feed_url)
+        if cached and cached['data'] is feed_data:
+            cached['entries'] = entries
+    return entries
+
+
+# Namespaces for the non-RSS-2.0 elements the metadata scan understands
+_ATOM_NS = '{http://www.w3.org/2005/Atom}'
+_DC_DATE = '{http://purl.org/dc/elements/1.1/}date'
+
+# Only the first few items are inspected to decide between audio and text
+FEED_TYPE_PROBE_ITEMS = 5
+
+
+def _parse_feed_date(text: str | None) -> datetime | None:
+    """Parse an RFC 822 or ISO 8601 feed date into a naive UTC datetime."""
+    if not text:
+        return None
+    text = text.strip()
     try:
-        feed_data = feedparser.parse(feed_url)
-        if not feed_data.entries:
-            return {'type': 'unknown', 'last_post': None, 'item_count': 0}
-        
-        # Determine feed type from first entry with content
+        dt = parsedate_to_datetime(text)
+    except (TypeError, ValueError):
+        try:
+            dt = datetime.fromisoformat(text.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt
+
+
+def _entry_datetime(entry) -> datetime | None:
+    """Return a feedparser entry's published (or updated) time as naive UTC."""
+    parsed = getattr(entry, 'published_parsed', None) or getattr(entry, 'updated_parsed', None)
+    # feedparser normalises these struct_times to UTC, so no timezone maths is needed
+    return datetime(*parsed[:6]) if parsed else None
+
+
+def scan_feed_metadata(url: str, etag: str | None = None, modified: str | None = None) -> dict | None:
+    """Stream a feed and collect just the metadata shown on the feeds page.
+
+    Items are parsed one at a time with ``iterparse`` and discarded as soon as
+    they've been inspected, so memory stays flat however long the feed is.
+    Returns ``None`` when the server answers 304 for the given validators and
+    raises ``ValueError`` if no RSS items or Atom entries are found.
+    """
+    headers = {}
+    if etag:
+        headers['If-None-Match'] = etag
+    if modified:
+        headers['If-Modified-Since'] = modified
+    with _source_http.get(url, headers=headers, stream=True, timeout=(5, 30)) as resp:
+        if resp.status_code == 304:
+            return None
+        resp.raise_for_status()
+        resp.raw.decode_content = True
+
         is_audio = False
-        for entry in feed_data.entries[:5]:  # Check first 5 entries
-            if entry.get('enclosures'):
-                is_audio = True
-                break
-        
-        feed_type = 'audio' if is_audio else 'text'
-        
-        # Get last post date from most recent entry
         last_post = None
-        last_post_str = None
-        for entry in feed_data.entries[:1]:
-            if getattr(entry, 'published_parsed', None):
-                last_post = datetime.fromtimestamp(time.mktime(entry.published_parsed))
-                last_post_str = last_post.isoformat()
-            elif getattr(entry, 'updated_parsed', None):
-                last_post = datetime.fromtimestamp(time.mktime(entry.updated_parsed))
-                last_post_str = last_post.isoformat()
-        
-        item_count = len(feed_data.entries)
-        
-        # Save to database
-        update_feed_metadata(feed_id, feed_type, last_post_str, item_count)
+        item_count = 0
+        for _, elem in etree.iterparse(resp.raw, tag=('item', f'{_ATOM_NS}entry')):
+            atom = elem.tag != 'item'
+            if item_count == 0:
+                if atom:
+                    date_text = elem.findtext(f'{_ATOM_NS}published') or elem.findtext(f'{_ATOM_NS}updated')
+                else:
+                    date_text = elem.findtext('pubDate') or elem.findtext(_DC_DATE)
+                last_post = _parse_feed_date(date_text)
+            if not is_audio and item_count < FEED_TYPE_PROBE_ITEMS:
+                if atom:
+                    is_audio = elem.find(f"{_ATOM_NS}link[@rel='enclosure']") is not None
+                else:
+                    is_audio = elem.find('enclosure') is not None
+            item_count += 1
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
+    if not item_count:
+        raise ValueError(f"No feed items found in {url}")
+    return {
+        'type': 'audio' if is_audio else 'text',
+        'last_post': last_post,
+        'item_count': item_count,
+        'etag': resp.headers.get('ETag'),
+        'modified': resp.headers.get('Last-Modified'),
+    }
+
+
+def _metadata_from_parsed_feed(feed_data) -> dict | None:
+    """Build the same metadata as ``scan_feed_metadata`` from a feedparser result."""
+    if feed_data is None:
+        return None
+    if not feed_data.entries:
+        raise ValueError("Feed has no entries")
+
+    # Determine feed type from first entry with content
+    is_audio = any(entry.get('enclosures') for entry in feed_data.entries[:FEED_TYPE_PROBE_ITEMS])
+
+    # Get last post date from most recent entry
+    last_post = _entry_datetime(feed_data.entries[0])
+
+    return {
+        'type': 'audio' if is_audio else 'text',
+        'last_post': last_post,
+        'item_count': len(feed_data.entries),
+        'etag': feed_data.get('etag'),
+        'modified': feed_data.get('modified'),
+    }
+
+
+def refresh_feed_metadata(feed_id: int, feed_url: str) -> dict:
+    """Fetch feed and update cached metadata. Returns the metadata dict."""
+    try:
+        feed = get_feed_by_id(feed_id)
+        etag = feed['etag'] if feed else None
+        modified = feed['modified'] if feed else None
+        try:
+            meta = scan_feed_metadata(feed_url, etag=etag, modified=modified)
+        except (requests.RequestException, etree.LxmlError, ValueError):
+            # Malformed or unusual feeds still get feedparser's lenient parsing
+            meta = _metadata_from_parsed_feed(parse_feed(feed_url, etag=etag, modified=modified))
+        if meta is None:
+            # Unchanged since the last refresh; the stored metadata is current
+            touch_feed_checked(feed_id)
+            last_post = None
+            if feed['last_post']:
+                try:
+                    last_post = datetime.fromisoformat(feed['last_post'])
+                except (ValueError, TypeError):
+                    pass
+            return {
+                'type': feed['feed_type'] or 'unknown',
+                'last_post': last_post,
+                'item_count': feed['item_count'] or 0,
+            }
         
-        return {
-            'type': feed_type,
-            'last_post': last_post,
-            'item_count': item_count
-        }
+        return _store_feed_metadata(feed_id, meta)
     except Exception:
         return {'type': 'unknown', 'last_post': None, 'item_count': 0}
 
 
+def _store_feed_metadata(feed_id: int, meta: dict) -> dict:
+    """Save scanned feed metadata and return the fields the feeds page shows."""
+    last_post = meta['last_post']
+    update_feed_metadata(
+        feed_id, meta['type'], last_post.isoformat() if last_post else None, meta['item_count'],
+        etag=meta['etag'],
+        modified=meta['modified'],
+    )
+    return {
+        'type': meta['type'],
+        'last_post': last_post,
+        'item_count': meta['item_count']
+    }
+
+
+def store_parsed_feed_metadata(feed_id: int, feed_data) -> None:
+    """Update a feed's metadata from a feed that has already been parsed.
+
+    Routes that parse the feed anyway use this instead of
+    ``refresh_feed_metadata`` so the feed isn't requested a second time.
+    """
+    try:
+        meta = _metadata_from_parsed_feed(feed_data)
+    except ValueError:
+        return
+    if meta:
+        _store_feed_metadata(feed_id, meta)
+
+
 @app.route('/', methods=['GET', 'POST'])
 def index():
     """List stored podcast feeds and allow new ones to be added."""
     if request.method == 'POST':
         # User submitted a new feed URL
         feed_url = request.form['feed_url']
-        feed = feedparser.parse(feed_url)
+        feed = parse_feed(feed_url)
         title = feed.feed.get('title', feed_url)
         feed_id = add_feed(feed_url, title)
-        # Refresh metadata for the new feed
-        refresh_feed_metadata(feed_id, feed_url)
+        # Fill in metadata for the new feed from the parse we already have
+        store_parsed_feed_metadata(feed_id, feed)
         return redirect(url_for('view_feed', feed_id=feed_id))
     
     # Get filter and sort parameters
@@ -718,7 +1445,12 @@ def index():
     sort_order = request.args.get('order', 'asc')
     search_query = request.args.get('q', '').lower()
     
-    raw_feeds = list_feeds()
+    raw_feeds = list_feeds(
+        feed_type=filter_type or None,
+        search=search_query or None,
+        order_by=sort_by,
+        descending=(sort_order == 'desc'),
+    )
     feeds_with_meta = []
     
     for f in raw_feeds:
@@ -730,7 +1462,7 @@ def index():
             except (ValueError, TypeError):
                 pass
         
-        feed_dict = {
+        feeds_with_meta.append({
             'id': f['id'],
             'title': f['title'],
             'url': f['url'],
@@ -738,39 +1470,7 @@ def index():
             'last_post': last_post,
             'item_count': f['item_count'] or 0,
             'last_checked': f['last_checked'],
-        }
-        
-        # Apply type filter
-        if filter_type and feed_dict['type'] != filter_type:
-            continue
-        
-        # Apply search filter
-        if search_query and search_query not in feed_dict['title'].lower():
-            continue
-        
-        feeds_with_meta.append(feed_dict)
-    
-    # Sort feeds
-    if sort_by == 'last_post':
-        feeds_with_meta.sort(
-            key=lambda x: x['last_post'] or datetime.min,
-            reverse=(sort_order == 'desc')
-        )
-    elif sort_by == 'type':
-        feeds_with_meta.sort(
-            key=lambda x: x['type'] or '',
-            reverse=(sort_order == 'desc')
-        )
-    elif sort_by == 'items':
-        feeds_with_meta.sort(
-            key=lambda x: x['item_count'] or 0,
-            reverse=(sort_order == 'desc')
-        )
-    else:  # Default: title
-        feeds_with_meta.sort(
-            key=lambda x: x['title'].lower(),
-            reverse=(sort_order == 'desc')
-        )
+        })
     
     return render_template(
         'feeds.html',
@@ -811,12 +1511,16 @@ def refresh_feed(feed_id: int):
 @app.route('/feeds/refresh-all')
 def refresh_all_feeds():
     """Refresh metadata for all feeds (runs in background thread)."""
+    def refresh_one(f):
+        try:
+            refresh_feed_metadata(f['id'], f['url'])
+        except Exception:
+            pass
+    
     def refresh_worker():
-        for f in list_feeds():
-            try:
-                refresh_feed_metadata(f['id'], f['url'])
-            except Exception:
-                pass
+        # Feed fetches are network-bound, so refresh several at once
+        with ThreadPoolExecutor(max_workers=FEED_REFRESH_WORKERS) as executor:
+            list(executor.map(refresh_one, list_feeds()))
     
     thread = threading.Thread(target=refresh_worker, daemon=True)
     thread.start()
@@ -830,55 +1534,38 @@ def view_feed(feed_id: int):
     if not feed:
         return redirect(url_for('index'))
     
-    # Refresh metadata when viewing a feed (it's just one feed, so it's fast)
-    refresh_feed_metadata(feed_id, feed['url'])
-    
     # Pagination parameters
     page = request.args.get('page', 1, type=int)
     per_page = request.args.get('per_page', 10, type=int)
     per_page = min(per_page, 50)  # Cap at 50 items per page
     
-    feed_data = feedparser.parse(feed['url'])
-    all_episodes = []
-    is_text_feed = True  # Assume text feed, switch to audio if we find enclosures
+    items = list(get_feed_entries(feed['url']).items())
+    # Refresh metadata from the same (cached) parse instead of fetching the feed again
+    store_parsed_feed_metadata(feed_id, parse_feed(feed['url']))
+    is_text_feed = not any(item['item_type'] == 'audio' for _, item in items)
     
-    # Audio file extensions to detect
-    audio_extensions = ('.mp3', '.m4a', '.wav', '.ogg', '.aac', '.flac')
+    # Calculate pagination
+    total_items = len(items)
+    total_pages = (total_items + per_page - 1) // per_page  # Ceiling division
+    start_idx = (page - 1) * per_page
+    end_idx = start_idx + per_page
     
-    for entry in feed_data.entries:
-        # Determine if this is an audio podcast or text feed
-        has_audio = bool(entry.get('enclosures'))
-        if has_audio:
-            is_text_feed = False
-            url = entry.enclosures[0].href
-            item_type = 'audio'
-        else:
-            # Text feed - use link as unique identifier
-            url = entry.get('link', entry.get('id', ''))
-            item_type = 'text'
-            if not url:
-                continue
-            # Check if the link itself is an audio file (some feeds use link instead of enclosure)
-            url_check = url.lower().split('?')[0]  # Remove query params
-            if url_check.endswith(audio_extensions):
-                is_text_feed = False
-                item_type = 'audio'
-        ep_db = get_episode(url)
+    # Second pass: build display data only for the current page
+    page_items = items[start_idx:end_idx]
+    processed = get_episodes_by_urls([url for url, _ in page_items])
+    episodes = []
+    for url, item in page_items:
+        entry = item['entry']
+        item_type = item['item_type']
+        ep_db = processed.get(url)
         status = {
-            'transcribed': ep_db is not None and bool(ep_db['transcript']),
-            'summarized': ep_db is not None and bool(ep_db['summary']),
-            'actions': ep_db is not None and bool(ep_db['action_items']),
+            'transcribed': ep_db is not None and bool(ep_db['transcribed']),
+            'summarized': ep_db is not None and bool(ep_db['summarized']),
+            'actions': ep_db is not None and bool(ep_db['has_actions']),
             'state': ep_db['status'] if ep_db else 'new',
         }
-        # Get full content for text feeds, description for podcasts
-        content = ''
-        if hasattr(entry, 'content') and entry.content:
-            content = entry.content[0].get('value', '')
-        if not content:
-            content = entry.get('summary') or entry.get('description', '')
-        # Prefer the summary element but fall back to description
-        desc = entry.get('summary') or entry.get('description', '')
-        clean_desc = strip_html(desc)
+        desc = item['description']
+        clean_desc = item['clean_description']
         # Try a few different locations for artwork
         img = None
         if hasattr(entry, 'image') and getattr(entry.image, 'href', None):
@@ -889,18 +1576,13 @@ def view_feed(feed_id: int):
             img = entry.media_thumbnail[0].get('url')
         elif entry.get('media_content'):
             img = entry.media_content[0].get('url')
-        published_ts = None
-        if getattr(entry, 'published_parsed', None):
-            published_ts = datetime.fromtimestamp(time.mktime(entry.published_parsed))
-        elif getattr(entry, 'updated_parsed', None):
-            published_ts = datetime.fromtimestamp(time.mktime(entry.updated_parsed))
+        published_ts = _entry_datetime(entry)
         published_iso = published_ts.isoformat() if published_ts else None
         # Get author if available
         author = entry.get('author', '')
-        all_episodes.append({
+        episodes.append({
             'title': entry.title,
-            'description': desc,
-            'content': content,
+            'description': sanitize_feed_html(desc),
             'clean_description': clean_desc,
             'short_description': make_short_description(clean_desc),
             'image': img,
@@ -912,13 +1594,6 @@ def view_feed(feed_id: int):
             'published': published_iso,
         })
     
-    # Calculate pagination
-    total_items = len(all_episodes)
-    total_pages = (total_items + per_page - 1) // per_page  # Ceiling division
-    start_idx = (page - 1) * per_page
-    end_idx = start_idx + per_page
-    episodes = all_episodes[start_idx:end_idx]
-    
     pagination = {
         'page': page,
         'per_page': per_page,
@@ -942,7 +1617,7 @@ def enqueue_episode():
     published = request.args.get('published')
     if not audio_url or feed_id is None:
         return redirect(url_for('index'))
-    queue_episode(audio_url, title, feed_id, published)
+    queue_episode(audio_url, title, feed_id, published, item_type='audio')
     task_queue.put({'url': audio_url, 'title': title, 'feed_id': feed_id, 'published': published})
     return redirect(url_for('status_page'))
 
@@ -962,45 +1637,32 @@ def process_text_article():
 
     app.logger.info("Processing text article: %s", article_url)
 
-    # Fetch content from the feed first
-    if feed_id:
-        feed = get_feed_by_id(feed_id)
-        if feed:
-            feed_data = feedparser.parse(feed['url'])
-            for entry in feed_data.entries:
-                entry_url = entry.get('link', entry.get('id', ''))
-                if entry_url == article_url:
-                    desc = entry.get('summary') or entry.get('description', '')
-                    description = strip_html(desc)
-                    # Get full content from feed
-                    if hasattr(entry, 'content') and entry.content:
-                        content = entry.content[0].get('value', '')
-                    if not content:
-                        content = desc
-                    content = strip_html(content)
-                    break
-    
-    # If RSS content is too short (likely just metadata/link), fetch the actual article
-    MIN_CONTENT_LENGTH = 500  # Minimum chars to consider content "full"
-    if len(content) < MIN_CONTENT_LENGTH:
-        app.logger.info("RSS content too short (%d chars), fetching from URL: %s", len(content), article_url)
-        fetched_content = fetch_article_content(article_url)
-        if fetched_content and len(fetched_content) > len(content):
-            app.logger.info("Fetched %d chars from article URL", len(fetched_content))
-            content = fetched_content
-        else:
-            app.logger.warning("Could not fetch better content from URL")
-
     # Reuse previously processed data if available
     existing = get_episode(article_url)
+    if existing and existing["description"] is not None:
+        # The description was stored on first processing, so skip the feed
+        description = existing["description"]
+    elif feed_id:
+        # Fetch content from the feed
+        feed = get_feed_by_id(feed_id)
+        item = get_feed_entries(feed['url']).get(article_url) if feed else None
+        if item:
+            entry = item['entry']
+            description = item['clean_description']
+            # Get full content from feed
+            if hasattr(entry, 'content') and entry.content:
+                content = strip_html(entry.content[0].get('value', ''))
+            if not content:
+                content = description
+        if existing:
+            set_episode_description(article_url, description)
+
     if existing:
         transcript = existing["transcript"]
         summary = existing["summary"]
-        actions = existing["action_items"].splitlines()
+        actions = load_action_items(existing["action_items"])
         tickets = [dict(t) for t in list_tickets(existing["id"])]
-        for t in tickets:
-            t["status"] = get_jira_issue_status(t["ticket_key"])
-            t["transitions"] = get_jira_issue_transitions(t["ticket_key"])
+        attach_jira_details(tickets)
         articles = [dict(a) for a in list_articles(existing["id"])]
         return render_template(
             'result.html',
@@ -1018,6 +1680,17 @@ def process_text_article():
             original_link=article_url,
         )
 
+    # If RSS content is too short (likely just metadata/link), fetch the actual article
+    MIN_CONTENT_LENGTH = 500  # Minimum chars to consider content "full"
+    if len(content) < MIN_CONTENT_LENGTH:
+        app.logger.info("RSS content too short (%d chars), fetching from URL: %s", len(content), article_url)
+        fetched_content = fetch_article_content(article_url)
+        if fetched_content and len(fetched_content) > len(content):
+            app.logger.info("Fetched %d chars from article URL", len(fetched_content))
+            content = fetched_content
+        else:
+            app.logger.warning("Could not fetch better content from URL")
+
     if not content:
         app.logger.error("No content found for article: %s", article_url)
         return redirect(url_for('view_feed', feed_id=feed_id))
@@ -1026,16 +1699,12 @@ def process_text_article():
     transcript = content
     app.logger.info("Article content loaded (%d chars)", len(transcript))
 
-    app.logger.info("Generating summary")
-    summary = summarize_text(transcript)
-    app.logger.info("Summary complete")
-
-    app.logger.info("Extracting action items")
-    actions = extract_action_items(transcript)
-    app.logger.info("Action item extraction complete")
+    app.logger.info("Generating summary and action items")
+    summary, actions = analyze_transcript(transcript)
+    app.logger.info("Summary and action item extraction complete")
 
     # Persist results
-    save_episode(article_url, title, transcript, summary, actions, feed_id, published)
+    save_episode(article_url, title, transcript, summary, actions, feed_id, published, description, item_type='text')
 
     return render_template(
         'result.html',
@@ -1065,26 +1734,25 @@ def process_episode():
     if not audio_url:
         return redirect(url_for('index'))
     app.logger.info("Processing episode: %s", audio_url)
-    if not description and feed_id:
-        feed = get_feed_by_id(feed_id)
-        if feed:
-            feed_data = feedparser.parse(feed['url'])
-            for entry in feed_data.entries:
-                if entry.get('enclosures') and entry.enclosures[0].href == audio_url:
-                    desc = entry.get('summary') or entry.get('description', '')
-                    description = strip_html(desc)
-                    break
     # Reuse previously processed data if available
     existing = get_episode(audio_url)
+    if existing and existing["description"] is not None:
+        # The description was stored on first processing, so skip the feed
+        description = existing["description"]
+    elif feed_id:
+        feed = get_feed_by_id(feed_id)
+        item = get_feed_entries(feed['url']).get(audio_url) if feed else None
+        if item:
+            description = item['clean_description']
+        if existing:
+            set_episode_description(audio_url, description)
     if existing:
         # Already processed - read results from the DB
         transcript = existing["transcript"]
         summary = existing["summary"]
-        actions = existing["action_items"].splitlines()
+        actions = load_action_items(existing["action_items"])
         tickets = [dict(t) for t in list_tickets(existing["id"])]
-        for t in tickets:
-            t["status"] = get_jira_issue_status(t["ticket_key"])
-            t["transitions"] = get_jira_issue_transitions(t["ticket_key"])
+        attach_jira_details(tickets)
         articles = [dict(a) for a in list_articles(existing["id"])]
         return render_template(
             'result.html',
@@ -1102,27 +1770,20 @@ def process_episode():
 
     with tempfile.TemporaryDirectory() as tmpdir:
         audio_path = os.path.join(tmpdir, 'episode.mp3')
-        with requests.get(audio_url, stream=True) as r:
-            r.raise_for_status()
-            with open(audio_path, 'wb') as f:
-                for chunk in r.iter_content(chunk_size=8192):
-                    f.write(chunk)
+        download_audio(audio_url, audio_path)
         # Run the same processing pipeline as the CLI
         app.logger.info("Transcribing audio")
-        transcript = transcribe_audio(audio_path)
+        with _transcribe_slots:
+            transcript = transcribe_audio(audio_path)
         app.logger.info("Transcription complete")
 
-        app.logger.info("Generating summary")
-        summary = summarize_text(transcript)
-        app.logger.info("Summary complete")
-
-        app.logger.info("Extracting action items")
-        actions = extract_action_items(transcript)
-        app.logger.info("Action item extraction complete")
+        app.logger.info("Generating summary and action items")
+        summary, actions = analyze_transcript(transcript)
+        app.logger.info("Summary and action item extraction complete")
         out_path = os.path.join(tmpdir, 'results.json')
         write_results_json(transcript, summary, actions, out_path)
         # Persist results so they can be reused later
-        save_episode(audio_url, title, transcript, summary, actions, feed_id, published)
+        save_episode(audio_url, title, transcript, summary, actions, feed_id, published, description, item_type='audio')
     return render_template(
         'result.html',
         title=title,
@@ -1158,25 +1819,33 @@ def create_jira():
         if feed:
             source_name = feed['title']
     
-    created = []
-    for item in items:
+    # Build description with source if available
+    source_line = f"Source: {source_name}\n" if source_name else ""
+
+    def create_one(item: str) -> dict:
+        description = (
+            f"Action item: {item}\n\n"
+            f"{source_line}"
+            f"From episode: {title}\n\n"
+            f"Episode summary:\n{summary_text}"
+        )
         try:
-            # Build description with source if available
-            source_line = f"Source: {source_name}\n" if source_name else ""
-            description = (
-                f"Action item: {item}\n\n"
-                f"{source_line}"
-                f"From episode: {title}\n\n"
-                f"Episode summary:\n{summary_text}"
-            )
             issue = create_jira_issue(item, description)
-            key = issue.get('key', '')
-            ticket_url = f"{os.environ.get('JIRA_BASE_URL')}/browse/{key}" if key else ''
-            if episode_id is not None and key:
-                add_ticket(episode_id, item, key, ticket_url)
-            created.append({'key': key, 'url': ticket_url})
         except Exception as exc:  # pragma: no cover - external call
-            created.append({'error': str(exc)})
+            return {'error': str(exc)}
+        key = issue.get('key', '')
+        return {'key': key, 'url': f"{JIRA_BASE_URL}/browse/{key}" if key else ''}
+
+    # Each ticket is an independent POST, so create them concurrently
+    with ThreadPoolExecutor(max_workers=min(JIRA_FETCH_WORKERS, len(items))) as executor:
+        created = list(executor.map(create_one, items))
+
+    if episode_id is not None:
+        add_tickets(episode_id, [
+            (item, result['key'], result['url'])
+            for item, result in zip(items, created)
+            if result.get('key')
+        ])
     return render_template('jira_result.html', created=created)
 
 
@@ -1258,13 +1927,16 @@ def list_api_routes():
                 'methods': list(rule.methods - {'HEAD', 'OPTIONS'}),
                 'path': str(rule)
             })
-    routes.sort(key=lambda x: x['path'])
+    routes.sort(key=itemgetter('path'))
     return jsonify({'routes': routes, 'count': len(routes)})
 
 
 @app.route('/status')
 def status_page():
     """Display processing status for all episodes."""
+    etag = page_etag(('episodes', 'feeds'))
+    if etag in request.if_none_match:
+        return not_modified(etag)
     sort = request.args.get('sort', 'released')
     sort_order = request.args.get('order', 'desc')
     filter_status = request.args.get('status', '')
@@ -1279,40 +1951,22 @@ def status_page():
     else:
         order_by = 'id'
     
-    all_episodes = list_all_episodes(order_by=order_by)
+    # Dates list newest first and ids oldest first unless ascending is requested
+    default_desc = order_by in ('published', 'processed_at')
+    episodes = list_all_episodes(
+        order_by=order_by,
+        descending=default_desc != (sort_order == 'asc'),
+        status=filter_status or None,
+        feed_id=int(filter_feed) if filter_feed.isdigit() else None,
+        item_type=filter_type or None,
+        search=search_query or None,
+    )
     feeds_list = list_feeds()
     feeds = {f["id"]: f["title"] for f in feeds_list}
     
-    # Filter episodes
-    filtered_episodes = []
-    for ep in all_episodes:
-        # Status filter
-        if filter_status and ep['status'] != filter_status:
-            continue
-        
-        # Feed filter
-        if filter_feed and str(ep['feed_id']) != filter_feed:
-            continue
-        
-        # Type filter (audio vs text)
-        is_audio = ep['url'].lower().split('?')[0].endswith(('.mp3', '.m4a', '.wav', '.ogg', '.aac', '.flac'))
-        ep_type = 'audio' if is_audio else 'text'
-        if filter_type and ep_type != filter_type:
-            continue
-        
-        # Search filter
-        if search_query and search_query not in (ep['title'] or '').lower():
-            continue
-        
-        filtered_episodes.append(ep)
-    
-    # Reverse order if ascending
-    if sort_order == 'asc':
-        filtered_episodes = list(reversed(filtered_episodes))
-    
-    return render_template(
+    return revalidated_response(render_template(
         'status.html',
-        episodes=filtered_episodes,
+        episodes=episodes,
         feeds=feeds,
         feeds_list=feeds_list,
         sort=sort,
@@ -1321,7 +1975,7 @@ def status_page():
         filter_feed=filter_feed,
         filter_type=filter_type,
         search_query=search_query,
-    )
+    ), etag)
 
 
 @app.route('/episode/<int:episode_id>/reprocess')
@@ -1331,14 +1985,10 @@ def reprocess_episode(episode_id: int):
     if not episode:
         return redirect(url_for('status_page'))
 
-    # Detect if this is audio or text
-    audio_extensions = ('.mp3', '.m4a', '.wav', '.ogg', '.aac', '.flac')
-    is_audio = episode['url'].lower().split('?')[0].endswith(audio_extensions)
-
     # Reset episode data for reprocessing
     reset_episode_for_reprocess(episode_id)
 
-    if is_audio:
+    if episode['item_type'] == 'audio':
         # Queue for background processing
         task_queue.put({
             'url': episode['url'],
@@ -1377,45 +2027,41 @@ def bulk_delete_episodes():
 @app.route('/tickets')
 def view_tickets():
     """Display all created JIRA tickets."""
+    # Statuses come from JIRA, so the tag also rolls over with the JIRA cache
+    # and whenever a transition made here invalidates it
+    jira_window = int(time.time() // JIRA_CACHE_SECONDS) if JIRA_CONFIGURED else 0
+    etag = page_etag(('jira_tickets', 'episodes'), jira_window, _jira_invalidations)
+    if etag in request.if_none_match:
+        return not_modified(etag)
     sort_by = request.args.get('sort', 'id')
     sort_order = request.args.get('order', 'desc')
     filter_status = request.args.get('status', '')
     search_query = request.args.get('q', '').lower()
     
-    raw_tickets = [dict(t) for t in list_tickets()]
-    
-    # Fetch JIRA statuses and filter
-    tickets = []
-    all_statuses = set()
-    
-    for t in raw_tickets:
-        t["status"] = get_jira_issue_status(t["ticket_key"])
-        t["transitions"] = get_jira_issue_transitions(t["ticket_key"])
-        all_statuses.add(t["status"] or "Unknown")
-        
-        # Filter by status
-        if filter_status and t["status"] != filter_status:
-            continue
-        
-        # Search filter
-        if search_query:
-            searchable = f"{t['episode_title']} {t['action_item']} {t['ticket_key']}".lower()
-            if search_query not in searchable:
-                continue
-        
-        tickets.append(t)
-    
-    # Sort tickets
-    if sort_by == 'episode':
-        tickets.sort(key=lambda x: (x['episode_title'] or '').lower(), reverse=(sort_order == 'desc'))
-    elif sort_by == 'status':
-        tickets.sort(key=lambda x: (x['status'] or '').lower(), reverse=(sort_order == 'desc'))
-    elif sort_by == 'ticket':
-        tickets.sort(key=lambda x: x['ticket_key'], reverse=(sort_order == 'desc'))
-    else:
-        tickets.sort(key=lambda x: x['id'], reverse=(sort_order == 'desc'))
+    # Most sorts run in SQL; status only exists in JIRA
+    tickets = [
+        dict(t) for t in list_tickets(
+            order_by=sort_by,
+            descending=(sort_order == 'desc'),
+        )
+    ]
     
-    return render_template(
+    # Fetch JIRA statuses concurrently. The status dropdown lists every
+    # ticket's status, so collect them before narrowing by the search.
+    attach_jira_details(tickets)
+    all_statuses = {t["status"] or "Unknown" for t in tickets}
+    if search_query:
+        # Same haystack and str.lower comparison as list_tickets' SQL search
+        tickets = [
+            t for t in tickets
+            if search_query in f"{t['episode_title'] or ''} {t['action_item']} {t['ticket_key']}".lower()
+        ]
+    if filter_status:
+        tickets = [t for t in tickets if t["status"] == filter_status]
+    if sort_by == 'status':
+        tickets.sort(key=lambda x: (x['status'] or '').casefold(), reverse=(sort_order == 'desc'))
+    
+    return revalidated_response(render_template(
         'tickets.html',
         tickets=tickets,
         sort_by=sort_by,
@@ -1423,7 +2069,7 @@ def view_tickets():
         filter_status=filter_status,
         search_query=search_query,
         all_statuses=sorted(all_statuses),
-    )
+    ), etag)
 
 
 @app.route('/generate_article', methods=['POST'])
@@ -1442,8 +2088,7 @@ def create_article():
         return redirect(url_for('index'))
 
     # Detect if this is a text article (not an audio file)
-    audio_extensions = ('.mp3', '.m4a', '.wav', '.ogg', '.aac', '.flac')
-    is_text_source = not episode_url.lower().split('?')[0].endswith(audio_extensions)
+    is_text_source = episode['item_type'] != 'audio'
 
     # Get the podcast/publication title for attribution
     feed = get_feed_by_id(episode['feed_id']) if episode['feed_id'] else None
@@ -1803,51 +2448,27 @@ def refine_article_with_ai(article_id: int):
 @app.route('/articles')
 def view_articles():
     """Display all generated articles."""
+    etag = page_etag(('articles', 'episodes', 'feeds'))
+    if etag in request.if_none_match:
+        return not_modified(etag)
     sort_by = request.args.get('sort', 'date')
     sort_order = request.args.get('order', 'desc')
     filter_style = request.args.get('style', '')
     filter_podcast = request.args.get('podcast', '')
     search_query = request.args.get('q', '').lower()
     
-    raw_articles = [dict(a) for a in list_articles()]
-    
-    # Collect unique styles and podcasts for filter dropdowns
-    all_styles = set()
-    all_podcasts = set()
-    
-    articles = []
-    for a in raw_articles:
-        all_styles.add(a['style'])
-        if a.get('podcast_title'):
-            all_podcasts.add(a['podcast_title'])
-        
-        # Filter by style
-        if filter_style and a['style'] != filter_style:
-            continue
-        
-        # Filter by podcast
-        if filter_podcast and a.get('podcast_title') != filter_podcast:
-            continue
-        
-        # Search filter
-        if search_query:
-            searchable = f"{a['topic']} {a.get('episode_title', '')} {a.get('podcast_title', '')}".lower()
-            if search_query not in searchable:
-                continue
-        
-        articles.append(a)
-    
-    # Sort articles
-    if sort_by == 'topic':
-        articles.sort(key=lambda x: x['topic'].lower(), reverse=(sort_order == 'desc'))
-    elif sort_by == 'style':
-        articles.sort(key=lambda x: x['style'].lower(), reverse=(sort_order == 'desc'))
-    elif sort_by == 'podcast':
-        articles.sort(key=lambda x: (x.get('podcast_title') or '').lower(), reverse=(sort_order == 'desc'))
-    else:  # Default: date
-        articles.sort(key=lambda x: x['created_at'] or '', reverse=(sort_order == 'desc'))
+    # Rows support the mapping/attribute access the template uses, so no dict copies
+    articles = list_articles(
+        style=filter_style or None,
+        podcast=filter_podcast or None,
+        search=search_query or None,
+        order_by=sort_by,
+        descending=(sort_order == 'desc'),
+    )
+    # Filter dropdowns list every value, not just those matching the current filter
+    all_styles, all_podcasts = list_article_filter_values()
     
-    return render_template(
+    return revalidated_response(render_template(
         'articles.html',
         articles=articles,
         sort_by=sort_by,
@@ -1855,9 +2476,9 @@ def view_articles():
         filter_style=filter_style,
         filter_podcast=filter_podcast,
         search_query=search_query,
-        all_styles=sorted(all_styles),
-        all_podcasts=sorted(all_podcasts),
-    )
+        all_styles=all_styles,
+        all_podcasts=all_podcasts,
+    ), etag)
 
 
 # ============================================================================
@@ -2463,6 +3084,7 @@ def schedule_add():
             article_id=article_id,
             platform=platform,
         )
+        notify_scheduler()
         
         # Format the display time
         scheduled_for_display = scheduled_for
@@ -2751,6 +3373,7 @@ def schedule_post_now(scheduled_id: int):
                 scheduled_time = datetime.fromisoformat(post['scheduled_for'])
                 if datetime.now() < scheduled_time:
                     redistribute_scheduled_posts(platform)
+                    notify_scheduler()
                 
                 return jsonify({"success": True, "message": "Posted to Threads!"})
             else:
@@ -2796,6 +3419,7 @@ def schedule_post_now(scheduled_id: int):
                 scheduled_time = datetime.fromisoformat(post['scheduled_for'])
                 if datetime.now() < scheduled_time:
                     redistribute_scheduled_posts(platform)
+                    notify_scheduler()
                 
                 return jsonify({"success": True, "message": "Posted to LinkedIn!"})
             else:
@@ -2939,6 +3563,7 @@ def schedule_reorder():
     success = reorder_scheduled_posts(post_ids)
     
     if success:
+        notify_scheduler()
         return jsonify({
             "success": True,
             "message": f"Reordered {len(post_ids)} posts"
@@ -2973,6 +3598,7 @@ def schedule_move_position():
     success = move_posts_to_position(post_ids, position)
     
     if success:
+        notify_scheduler()
         return jsonify({
             "success": True,
             "message": f"Moved {len(post_ids)} post(s) to {position}"
@@ -3004,6 +3630,7 @@ def schedule_edit(scheduled_id: int):
     success = update_scheduled_post_time(scheduled_id, scheduled_for)
     
     if success:
+        notify_scheduler()
         # Format the display time
         try:
             display = dt.strftime('%A, %B %d at %I:%M %p')
@@ -3076,6 +3703,7 @@ def schedule_slot_add():
     # Redistribute all pending posts to use the new optimal slots
     linkedin_redistributed = redistribute_scheduled_posts('linkedin')
     threads_redistributed = redistribute_scheduled_posts('threads')
+    notify_scheduler()
     
     day_names = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
     day_display = 'Every day' if day_of_week == -1 else day_names[day_of_week]
@@ -3111,6 +3739,7 @@ def schedule_slot_toggle(slot_id: int):
     # Redistribute all pending posts to use the new optimal slots
     redistribute_scheduled_posts('linkedin')
     redistribute_scheduled_posts('threads')
+    notify_scheduler()
     
     return jsonify({
         "success": True,
@@ -3149,6 +3778,7 @@ def schedule_slot_edit(slot_id: int):
     # Redistribute all pending posts to use the new optimal slots
     linkedin_redistributed = redistribute_scheduled_posts('linkedin')
     threads_redistributed = redistribute_scheduled_posts('threads')
+    notify_scheduler()
     
     return jsonify({
         "success": True,
@@ -3167,6 +3797,7 @@ def schedule_slot_delete(slot_id: int):
     # Redistribute all pending posts to use the remaining slots
     redistribute_scheduled_posts('linkedin')
     redistribute_scheduled_posts('threads')
+    notify_scheduler()
     return jsonify({"success": True, "message": "Slot deleted"})
 
 
@@ -3194,6 +3825,7 @@ def schedule_daily_limits():
     
     # Redistribute posts for this platform to respect the new limit
     redistributed = redistribute_scheduled_posts(platform)
+    notify_scheduler()
     
     return jsonify({
         "success": True,
@@ -3445,11 +4077,25 @@ def compose_generate():
         platforms = ['linkedin', 'threads', 'twitter']
     
     posts_per_platform = max(1, min(posts_per_platform, 10))
-    
+
+    if source_type not in ('freeform', 'url', 'text'):
+        return jsonify({"error": f"Unknown source type: {source_type}"}), 400
+
+    cache_key = None
+    if LLM_CACHE_ENABLED:
+        cache_key = generation_cache_key(
+            source_type, content, platforms, tone, posts_per_platform, extra_context, topic,
+        )
+
     try:
-        # Generate posts based on source type
+        # Serve identical requests from the cache, otherwise generate by source type
         source_data = None
-        if source_type == 'freeform':
+        cached = get_generation_cache(cache_key) if cache_key else None
+        if cached:
+            cached_data = json.loads(cached)
+            generated = cached_data.get("generated", {})
+            source_data = cached_data.get("source_data")
+        elif source_type == 'freeform':
             generated = generate_posts_from_prompt(
                 prompt=content,
                 platforms=platforms,
@@ -3468,18 +4114,7 @@ def compose_generate():
             # New structure: {"posts": {...}, "source_data": {...}}
             generated = result.get("posts", result)
             source_data = result.get("source_data")
-            
-            # Auto-save URL content to url_sources
-            if source_data:
-                source_id = add_url_source(
-                    url=source_data.get("url", content),
-                    title=source_data.get("title", ""),
-                    description=source_data.get("description", ""),
-                    content=source_data.get("content", ""),
-                    og_image=source_data.get("og_image"),
-                )
-                source_data["source_id"] = source_id
-        elif source_type == 'text':
+        else:  # text
             generated = generate_posts_from_text(
                 text=content,
                 platforms=platforms,
@@ -3488,11 +4123,28 @@ def compose_generate():
                 posts_per_platform=posts_per_platform,
                 extra_context=extra_context,
             )
-        else:
-            return jsonify({"error": f"Unknown source type: {source_type}"}), 400
-        
-        # Save generated posts to database
+
+        if cache_key and not cached and is_cacheable_generation(generated):
+            set_generation_cache(
+                cache_key,
+                json.dumps({"generated": generated, "source_data": source_data}),
+                ttl_seconds=LLM_CACHE_TTL,
+            )
+
+        # Auto-save URL content to url_sources
+        if source_data:
+            source_id = add_url_source(
+                url=source_data.get("url", content),
+                title=source_data.get("title", ""),
+                description=source_data.get("description", ""),
+                content=source_data.get("content", ""),
+                og_image=source_data.get("og_image"),
+            )
+            source_data["source_id"] = source_id
+
+        # Save generated posts to database in a single transaction
         saved_posts = {}
+        rows = []
         for platform, post_data in generated.items():
             if platform == 'raw':
                 # Handle raw response (JSON parsing failed)
@@ -3500,20 +4152,20 @@ def compose_generate():
             
             posts_list = post_data if isinstance(post_data, list) else [post_data]
             saved_posts[platform] = []
-            
-            for post_content in posts_list:
-                post_id = add_standalone_post(
-                    source_type=source_type,
-                    source_content=content[:1000],  # Truncate for storage
-                    platform=platform,
-                    content=post_content,
-                    image_url=image_url,
-                )
-                saved_posts[platform].append({
-                    'id': post_id,
-                    'content': post_content,
-                    'image_url': image_url,
-                })
+            rows.extend((platform, post_content) for post_content in posts_list)
+        
+        post_ids = add_standalone_posts_bulk(
+            source_type=source_type,
+            source_content=content[:1000],
+            posts=rows,
+            image_url=image_url,
+        )
+        for (platform, post_content), post_id in zip(rows, post_ids):
+            saved_posts[platform].append({
+                'id': post_id,
+                'content': post_content,
+                'image_url': image_url,
+            })
         
         response_data = {
             "success": True,
@@ -3522,8 +4174,11 @@ def compose_generate():
         }
         if source_data:
             response_data["source_data"] = source_data
-        
-        return jsonify(response_data)
+
+        response = jsonify(response_data)
+        if cache_key:
+            response.headers['X-Cache'] = 'HIT' if cached else 'MISS'
+        return response
         
     except Exception as e:
         app.logger.exception("Failed to generate posts")
@@ -3731,6 +4386,10 @@ def compose_stock_images_status():
 @app.route('/compose/upload-image', methods=['POST'])
 def compose_upload_image():
     """Upload an image file and return its URL."""
+    # Reject oversized requests before the multipart body is parsed
+    if request.content_length and request.content_length > MAX_UPLOAD_SIZE:
+        return jsonify({"error": f"File too large. Maximum size is {MAX_UPLOAD_SIZE // (1024 * 1024)}MB"}), 413
+
     if 'image' not in request.files:
         return jsonify({"error": "No image file provided"}), 400
     
@@ -3742,25 +4401,38 @@ def compose_upload_image():
     # Check extension first (fast rejection)
     if not allowed_file(file.filename):
         return jsonify({"error": f"File type not allowed. Allowed types: {', '.join(ALLOWED_EXTENSIONS)}"}), 400
-    
+
+    if not (file.mimetype or '').startswith('image/'):
+        return jsonify({"error": "Uploaded file is not an image"}), 400
+
     # Validate image content and re-encode to strip embedded data
     try:
         cleaned_bytes, ext = validate_and_clean_image(file)
     except ValueError as e:
         return jsonify({"error": str(e)}), 400
     
+    # Persist the cleaned image once; Cloudinary streams it from disk and the
+    # same file doubles as the local-storage fallback
+    unique_filename = f"{uuid.uuid4().hex}.{ext}"
+    filepath = os.path.join(app.config['UPLOAD_FOLDER'], unique_filename)
+    local_size = len(cleaned_bytes)
+
+    with open(filepath, 'wb') as f:
+        f.write(cleaned_bytes)
+    del cleaned_bytes
+
     # Upload to Cloudinary if configured (for public URLs that work with Threads)
     if CLOUDINARY_CONFIGURED:
         try:
             result = cloudinary.uploader.upload(
-                cleaned_bytes,
+                filepath,
                 folder="podinsights",
                 resource_type="image"
             )
             image_url = result['secure_url']
             filename = result['public_id'].split('/')[-1]
-            file_size = result.get('bytes', len(cleaned_bytes))
-            
+            file_size = result.get('bytes', local_size)
+
             # Save to database for image library
             add_uploaded_image(
                 filename=filename,
@@ -3768,7 +4440,13 @@ def compose_upload_image():
                 storage='cloudinary',
                 size=file_size
             )
-            
+
+            # Cloudinary holds the canonical copy; drop the local one
+            try:
+                os.remove(filepath)
+            except OSError:
+                app.logger.warning("Could not remove local copy %s", filepath)
+
             return jsonify({
                 "success": True,
                 "image_url": image_url,
@@ -3777,23 +4455,16 @@ def compose_upload_image():
             })
         except Exception as e:
             app.logger.error("Cloudinary upload failed: %s", str(e))
-            # Fall back to local storage
-    
-    # Local storage fallback
-    unique_filename = f"{uuid.uuid4().hex}.{ext}"
-    filepath = os.path.join(app.config['UPLOAD_FOLDER'], unique_filename)
-    
-    with open(filepath, 'wb') as f:
-        f.write(cleaned_bytes)
-    
-    image_url = f"{request.host_url}static/uploads/{unique_filename}"
-    
+            # Fall back to the local copy already on disk
+
+    image_url = f"{g.host_url}static/uploads/{unique_filename}"
+
     # Save to database for image library
     add_uploaded_image(
         filename=unique_filename,
         url=f"/static/uploads/{unique_filename}",
         storage='local',
-        size=len(cleaned_bytes)
+        size=local_size
     )
     
     return jsonify({
@@ -3808,44 +4479,37 @@ def compose_upload_image():
 @app.route('/compose/list-images', methods=['GET'])
 def compose_list_images():
     """List all uploaded images from database and local folder."""
-    from datetime import datetime as dt
-    
     images = []
     seen_urls = set()
-    
+
     # First, get images from the database (includes Cloudinary images)
     db_images = list_uploaded_images()
     for img in db_images:
-        # Convert ISO datetime string to timestamp for consistent sorting
-        created_at = img['created_at']
-        try:
-            if created_at:
-                timestamp = dt.fromisoformat(created_at).timestamp()
-            else:
-                timestamp = 0
-        except (ValueError, TypeError):
-            timestamp = 0
-        
         images.append({
             'id': img['id'],
             'filename': img['filename'],
             'url': img['url'],
             'size': img['size'] or 0,
             'storage': img['storage'],
-            'created_at': created_at,
-            'modified': timestamp,
+            'created_at': img['created_at'],
+            # Epoch seconds stored at insert time for consistent sorting
+            'modified': img['created_at_ts'] or 0,
         })
         seen_urls.add(img['url'])
     
     # Also scan local uploads folder for any images not in database (backward compatibility)
     upload_dir = app.config['UPLOAD_FOLDER']
     if os.path.exists(upload_dir):
-        for filename in os.listdir(upload_dir):
-            if allowed_file(filename):
+        with os.scandir(upload_dir) as entries:
+            for entry in entries:
+                filename = entry.name
+                # Inline extension check (same rule as allowed_file) for the hot scan
+                ext = filename.rpartition('.')[2].lower()
+                if '.' not in filename or ext not in ALLOWED_EXTENSIONS:
+                    continue
                 local_url = f"/static/uploads/{filename}"
                 if local_url not in seen_urls:
-                    filepath = os.path.join(upload_dir, filename)
-                    stat = os.stat(filepath)
+                    stat = entry.stat()
                     images.append({
                         'filename': filename,
                         'url': local_url,
@@ -3926,11 +4590,11 @@ def compose_bulk_update_images():
     # Convert to integers
     post_ids = [int(pid) for pid in post_ids]
     
-    # Update each post's image
+    # Look up all selected posts in one query, then update the ones that exist
+    posts = get_standalone_posts_bulk(post_ids)
     updated = 0
     for post_id in post_ids:
-        post = get_standalone_post(post_id)
-        if post:
+        if post_id in posts:
             update_standalone_post_image(post_id, image_url if image_url else None)
             updated += 1
     
@@ -3944,12 +4608,10 @@ def compose_bulk_update_images():
 @app.route('/compose/post/<int:post_id>/toggle-used', methods=['POST'])
 def compose_toggle_used(post_id: int):
     """Toggle a standalone post's used status."""
-    post = get_standalone_post(post_id)
-    if not post:
+    new_status = toggle_standalone_post_used(post_id)
+    if new_status is None:
         return jsonify({"error": "Post not found"}), 404
-    
-    new_status = not bool(post['used'])
-    mark_standalone_post_used(post_id, new_status)
+
     return jsonify({"success": True, "used": new_status})
 
 
@@ -4161,6 +4823,7 @@ def compose_add_to_queue(post_id: int):
         scheduled_for=schedule_time,
         status='pending',
     )
+    notify_scheduler()
     
     # Format the display time
     try:
@@ -4185,14 +4848,9 @@ def compose_remove_from_queue(post_id: int):
     if not post:
         return jsonify({"error": "Post not found"}), 404
     
-    # Find and delete any scheduled posts for this standalone post
-    scheduled_posts = list_scheduled_posts(status='pending')
-    removed = 0
-    for sp in scheduled_posts:
-        if sp.get('standalone_post_id') == post_id:
-            delete_scheduled_post(sp['id'])
-            removed += 1
-    
+    # Delete any pending scheduled posts for this standalone post
+    removed = delete_scheduled_posts_by_standalone_id(post_id)
+
     if removed == 0:
         return jsonify({"error": "Post not found in queue"}), 404
     
@@ -4206,13 +4864,10 @@ def compose_remove_from_queue(post_id: int):
 @app.route('/compose/clear-all', methods=['POST'])
 def compose_clear_all():
     """Clear all standalone posts."""
-    posts = list_standalone_posts()
-    if not posts:
+    deleted = delete_all_standalone_posts()
+    if deleted == 0:
         return jsonify({"success": True, "message": "No posts to clear"})
     
-    post_ids = [p['id'] for p in posts]
-    deleted = delete_standalone_posts_bulk(post_ids)
-    
     return jsonify({
         "success": True,
         "deleted_count": deleted,
@@ -4235,8 +4890,6 @@ def sources_page():
 @app.route('/sources', methods=['POST'])
 def add_source():
     """Add a new URL source by extracting content from a URL."""
-    import trafilatura
-    
     # Accept URL from JSON or form data
     if request.is_json:
         url = request.json.get('url', '').strip()
@@ -4259,72 +4912,14 @@ def add_source():
         }), 409
     
     try:
-        # Fetch the URL content using trafilatura
-        downloaded = trafilatura.fetch_url(url)
+        # Fetch the URL content over the shared connection pool
+        fetched = fetch_source_html(url)
         
-        if not downloaded:
+        if not fetched:
             return jsonify({"error": "Failed to fetch URL content. Please check the URL is accessible."}), 400
         
-        # Extract main article content
-        body_content = trafilatura.extract(
-            downloaded,
-            include_comments=False,
-            include_tables=True,
-            favor_precision=True,
-        ) or ""
-        
-        # Extract metadata
-        metadata = trafilatura.extract_metadata(downloaded)
-        
-        title = ""
-        description = ""
-        og_image = None
-        
-        if metadata:
-            title = metadata.title or ""
-            description = metadata.description or ""
-            og_image = metadata.image
-        
-        # Fallback metadata extraction from HTML if needed
-        if not title or not description or not og_image:
-            import re as re_module
-            
-            if not title:
-                title_match = re_module.search(r'<title>([^<]+)</title>', downloaded, re_module.IGNORECASE)
-                if title_match:
-                    title = title_match.group(1).strip()
-                
-                og_title_match = re_module.search(
-                    r'<meta[^>]*property=["\']og:title["\'][^>]*content=["\']([^"\']+)["\']',
-                    downloaded, re_module.IGNORECASE
-                )
-                if og_title_match:
-                    title = og_title_match.group(1)
-            
-            if not description:
-                # Try og:description
-                og_desc_match = re_module.search(
-                    r'<meta[^>]*property=["\']og:description["\'][^>]*content=["\']([^"\']+)["\']',
-                    downloaded, re_module.IGNORECASE
-                )
-                if og_desc_match:
-                    description = og_desc_match.group(1)
-                else:
-                    # Try meta description
-                    meta_desc_match = re_module.search(
-                        r'<meta[^>]*name=["\']description["\'][^>]*content=["\']([^"\']+)["\']',
-                        downloaded, re_module.IGNORECASE
-                    )
-                    if meta_desc_match:
-                        description = meta_desc_match.group(1)
-            
-            if not og_image:
-                og_image_match = re_module.search(
-                    r'<meta[^>]*property=["\']og:image["\'][^>]*content=["\']([^"\']+)["\']',
-                    downloaded, re_module.IGNORECASE
-                )
-                if og_image_match:
-                    og_image = og_image_match.group(1)
+        # Extract article content and metadata (memoized on the page hash)
+        title, description, body_content, og_image = extract_source_content(*fetched)
         
         # Use URL as title fallback
         if not title:
@@ -4379,8 +4974,6 @@ def delete_source(source_id: int):
 @app.route('/sources/<int:source_id>/reextract', methods=['POST'])
 def reextract_source(source_id: int):
     """Re-extract content from a URL source using improved extraction."""
-    import trafilatura
-    
     source = get_url_source(source_id)
     if not source:
         return jsonify({"error": "Source not found"}), 404
@@ -4388,63 +4981,14 @@ def reextract_source(source_id: int):
     url = source['url']
     
     try:
-        # Use trafilatura for robust article extraction
-        downloaded = trafilatura.fetch_url(url)
+        # Fetch the URL content over the shared connection pool
+        fetched = fetch_source_html(url)
         
-        if not downloaded:
+        if not fetched:
             return jsonify({"error": "Failed to fetch URL content"}), 500
         
-        # Extract main article content
-        body_content = trafilatura.extract(
-            downloaded,
-            include_comments=False,
-            include_tables=True,
-            favor_precision=True,
-        ) or ""
-        
-        # Extract metadata
-        metadata = trafilatura.extract_metadata(downloaded)
-        
-        title = ""
-        description = ""
-        og_image = None
-        
-        if metadata:
-            title = metadata.title or ""
-            description = metadata.description or ""
-            og_image = metadata.image
-        
-        # Fallback metadata extraction from HTML if needed
-        if not title or not description:
-            import re
-            
-            if not title:
-                title_match = re.search(r'<title>([^<]+)</title>', downloaded, re.IGNORECASE)
-                if title_match:
-                    title = title_match.group(1).strip()
-                
-                og_title_match = re.search(
-                    r'<meta[^>]*property=["\']og:title["\'][^>]*content=["\']([^"\']+)["\']',
-                    downloaded, re.IGNORECASE
-                )
-                if og_title_match:
-                    title = og_title_match.group(1)
-            
-            if not description:
-                og_desc_match = re.search(
-                    r'<meta[^>]*property=["\']og:description["\'][^>]*content=["\']([^"\']+)["\']',
-                    downloaded, re.IGNORECASE
-                )
-                if og_desc_match:
-                    description = og_desc_match.group(1)
-            
-            if not og_image:
-                og_image_match = re.search(
-                    r'<meta[^>]*property=["\']og:image["\'][^>]*content=["\']([^"\']+)["\']',
-                    downloaded, re.IGNORECASE
-                )
-                if og_image_match:
-                    og_image = og_image_match.group(1)
+        # Extract article content and metadata (memoized on the page hash)
+        title, description, body_content, og_image = extract_source_content(*fetched)
         
         # Update the source in the database
         updated = update_url_source_content(
@@ -4502,55 +5046,88 @@ def compose_generate_from_source():
         # Import here to avoid circular dependency
         from podinsights import generate_posts_from_text
         
-        # Build context from the saved source
+        # Build context from the saved source. The URL goes ahead of the
+        # description and content so trimming can never cut it off.
         source_text = f"TITLE: {source['title']}\n\n"
+        source_text += f"ORIGINAL URL: {source['url']}\n\n"
         if source['description']:
             source_text += f"DESCRIPTION: {source['description']}\n\n"
-        source_text += f"CONTENT: {source['content']}\n\n"
-        source_text += f"ORIGINAL URL: {source['url']}"
+        source_text += "CONTENT: "
         
-        # Generate posts using the saved content
-        generated = generate_posts_from_text(
-            text=source_text,
-            platforms=platforms,
-            tone=tone,
-            topic=source['title'],
-            posts_per_platform=posts_per_platform,
-            extra_context=extra_context,
-        )
+        # Fit the body into what's left of the generator's input budget. Long
+        # articles keep their opening and their closing paragraphs; the
+        # middle is dropped.
+        body = source['content'] or ''
+        budget = max(0, GENERATION_INPUT_CHARS - len(source_text))
+        if len(body) > budget:
+            marker = "\n...\n"
+            head = budget - SOURCE_TAIL_CHARS - len(marker)
+            if head > SOURCE_TAIL_CHARS:
+                body = body[:head] + marker + body[-SOURCE_TAIL_CHARS:]
+            else:
+                # Too little room left for both ends; keep the opening only
+                body = body[:budget]
+        source_text += body
+        
+        cache_key = None
+        cached = None
+        if LLM_CACHE_ENABLED:
+            cache_key = generation_cache_key(
+                'saved_source', source_text, platforms, tone, posts_per_platform, extra_context,
+            )
+            cached = get_generation_cache(cache_key)
+        
+        if cached:
+            generated = json.loads(cached)
+        else:
+            # Generate posts using the saved content
+            generated = generate_posts_from_text(
+                text=source_text,
+                platforms=platforms,
+                tone=tone,
+                topic=source['title'],
+                posts_per_platform=posts_per_platform,
+                extra_context=extra_context,
+            )
+            if cache_key and is_cacheable_generation(generated):
+                set_generation_cache(cache_key, json.dumps(generated), ttl_seconds=SOURCE_CACHE_TTL)
         
         # Update last_used_at timestamp
         update_url_source_last_used(source_id)
         
-        # Save generated posts to database
+        # Save generated posts to database in a single transaction
         saved_posts = {}
+        rows = []
         for platform, post_data in generated.items():
             if platform == 'raw':
                 continue
             
             posts_list = post_data if isinstance(post_data, list) else [post_data]
             saved_posts[platform] = []
-            
-            for post_content in posts_list:
-                post_id = add_standalone_post(
-                    source_type='saved_source',
-                    source_content=source['url'][:1000],
-                    platform=platform,
-                    content=post_content,
-                    image_url=image_url,
-                )
-                saved_posts[platform].append({
-                    'id': post_id,
-                    'content': post_content,
-                    'image_url': image_url,
-                })
+            rows.extend((platform, post_content) for post_content in posts_list)
         
-        return jsonify({
+        post_ids = add_standalone_posts_bulk(
+            source_type='saved_source',
+            source_content=source['url'][:1000],
+            posts=rows,
+            image_url=image_url,
+        )
+        for (platform, post_content), post_id in zip(rows, post_ids):
+            saved_posts[platform].append({
+                'id': post_id,
+                'content': post_content,
+                'image_url': image_url,
+            })
+        
+        response = jsonify({
             "success": True,
             "generated": generated,
             "saved_posts": saved_posts,
             "source_title": source['title'],
         })
+        if cache_key:
+            response.headers['X-Cache'] = 'HIT' if cached else 'MISS'
+        return response
         
     except Exception as e:
         app.logger.exception("Failed to generate posts from source")
@@ -4562,213 +5139,254 @@ def compose_generate_from_source():
 # ============================================================================
 
 
+# Wakes the scheduled post worker when the queue changes
+_scheduler_cv = threading.Condition()
+_scheduler_generation = 0
+SCHEDULER_IDLE_WAIT = 300  # seconds to sleep when nothing is due soon
+
+
+def notify_scheduler() -> None:
+    """Wake the scheduled post worker so it re-reads the queue."""
+    global _scheduler_generation
+    with _scheduler_cv:
+        _scheduler_generation += 1
+        _scheduler_cv.notify_all()
+
+
+def wait_for_next_scheduled_post() -> None:
+    """Sleep until the earliest pending post is due or the queue changes."""
+    with _scheduler_cv:
+        generation = _scheduler_generation
+
+    timeout = SCHEDULER_IDLE_WAIT
+    next_due = get_next_scheduled_time()
+    if next_due:
+        try:
+            due = datetime.fromisoformat(next_due)
+            if due.tzinfo is not None:
+                due = due.astimezone().replace(tzinfo=None)
+            delta = (due - datetime.now()).total_seconds()
+            timeout = min(max(delta, 1), SCHEDULER_IDLE_WAIT)
+        except (ValueError, TypeError):
+            pass
+
+    with _scheduler_cv:
+        _scheduler_cv.wait_for(lambda: _scheduler_generation != generation, timeout=timeout)
+
+
+SCHEDULER_PUBLISH_WORKERS = 4  # posts published in parallel when several are due
+SCHEDULER_TOKEN_TTL = 3600  # seconds before cached tokens are re-read from the DB
+SCHEDULER_BATCH_SIZE = 50  # due posts fetched per query when draining a backlog
+
+
+def _get_scheduler_token(tokens: dict, platform: str) -> tuple[dict | None, str | None]:
+    """Return ``(token, error_message)`` for a platform, refreshing if expired.
+
+    Runs under the cache lock so parallel publishes don't refresh the same
+    token twice; the first caller refreshes and the rest reuse the result.
+    """
+    with tokens['lock']:
+        if platform == 'threads':
+            if tokens['threads'] is None:
+                tokens['threads'] = get_threads_token()
+            threads_token = tokens['threads']
+            
+            if not threads_token:
+                return None, 'Threads not connected'
+            
+            # Check token expiry and refresh if needed
+            if threads_is_token_expired(threads_token['expires_at']):
+                threads_client = get_threads_client()
+                try:
+                    new_token = threads_client.refresh_access_token(threads_token['access_token'])
+                    expires_at = threads_calculate_token_expiry(new_token.get('expires_in', 5184000))
+                    update_threads_token(
+                        access_token=new_token['access_token'],
+                        expires_at=expires_at,
+                    )
+                    threads_token = tokens['threads'] = get_threads_token()
+                except Exception as e:
+                    app.logger.error("Failed to refresh Threads token: %s", e)
+                    return None, 'Threads token expired'
+            return threads_token, None
+        
+        if tokens['linkedin'] is None:
+            tokens['linkedin'] = get_linkedin_token()
+        linkedin_token = tokens['linkedin']
+        
+        if not linkedin_token:
+            return None, 'LinkedIn not connected'
+        
+        # Check token expiry and refresh if needed
+        if is_token_expired(linkedin_token['expires_at']):
+            if not linkedin_token['refresh_token']:
+                app.logger.warning("LinkedIn token expired and no refresh token is stored")
+                return None, 'LinkedIn token expired'
+            linkedin_client = get_linkedin_client()
+            try:
+                new_token = linkedin_client.refresh_access_token(linkedin_token['refresh_token'])
+                expires_at = calculate_token_expiry(new_token.get('expires_in', 5184000))
+                update_linkedin_token(
+                    access_token=new_token['access_token'],
+                    expires_at=expires_at,
+                    refresh_token=new_token.get('refresh_token'),
+                )
+                linkedin_token = tokens['linkedin'] = get_linkedin_token()
+            except Exception as e:
+                app.logger.error("Failed to refresh LinkedIn token: %s", e)
+                return None, 'LinkedIn token expired'
+        return linkedin_token, None
+
+
+def _publish_scheduled_post(post, tokens: dict) -> None:
+    """Publish one due scheduled post and record the outcome."""
+    # Bind the Row's columns once; sqlite3.Row lookups by name scan the column list
+    row = dict(post)
+    pid = row['id']
+    try:
+        platform = row.get('platform') or 'linkedin'
+        post_type = row.get('post_type')
+        article_topic = row.get('article_topic')
+        social_post_id = row.get('social_post_id')
+        standalone_post_id = row.get('standalone_post_id')
+        
+        # Determine content and image based on post type
+        image_url = None
+        if post_type == 'social' and row.get('social_content'):
+            content = row['social_content']
+            image_url = row.get('social_image_url')
+        elif post_type == 'article' and row.get('article_content'):
+            content = f"{article_topic}\n\n{row['article_content'][:2800]}"
+        elif post_type == 'standalone' and row.get('standalone_content'):
+            content = row['standalone_content']
+            image_url = row.get('standalone_image_url')
+        else:
+            app.logger.warning("Scheduled post %d has no content", pid)
+            update_scheduled_post_status(
+                pid,
+                status='failed',
+                error_message='No content found',
+            )
+            return
+        
+        token, token_error = _get_scheduler_token(tokens, platform)
+        if not token:
+            app.logger.warning("Scheduled %s post %d not published: %s", platform, pid, token_error)
+            update_scheduled_post_status(
+                pid,
+                status='failed',
+                error_message=token_error,
+            )
+            return
+        
+        if platform == 'threads':
+            threads_client = get_threads_client()
+            
+            # Use image post if image URL is available
+            if image_url:
+                app.logger.info("Posting Threads with image: %s", image_url)
+                result = threads_client.publish_image_post(
+                    access_token=token['access_token'],
+                    text=content[:500],  # Threads has 500 char limit
+                    image_url=image_url,
+                )
+            else:
+                result = threads_client.publish_text_post(
+                    access_token=token['access_token'],
+                    text=content[:500],  # Threads has 500 char limit
+                )
+            post_ref = result.get('permalink')  # Store permalink for view link
+            platform_name = 'Threads'
+        else:
+            linkedin_client = get_linkedin_client()
+            text = content[:3000]
+            
+            # Use image post if image URL is available and no URL in the posted text
+            has_url = bool(image_url) and linkedin_client.extract_first_url(text) is not None
+            if image_url and not has_url:
+                app.logger.info("Posting LinkedIn with image: %s", image_url)
+                result = linkedin_client.create_image_post(
+                    access_token=token['access_token'],
+                    author_urn=token['user_urn'],
+                    text=text,
+                    image_url=image_url,
+                )
+            else:
+                result = linkedin_client.create_smart_post(
+                    access_token=token['access_token'],
+                    author_urn=token['user_urn'],
+                    text=text,
+                    article_title=article_topic,
+                )
+            post_ref = result.get('post_urn')
+            platform_name = 'LinkedIn'
+        
+        if result['success']:
+            update_scheduled_post_status(
+                pid,
+                status='posted',
+                linkedin_post_urn=post_ref,
+            )
+            if social_post_id:
+                mark_social_post_used(social_post_id, True)
+            if standalone_post_id:
+                mark_standalone_post_used(standalone_post_id, True)
+            app.logger.info("Scheduled %s post %d published successfully", platform_name, pid)
+        else:
+            error_msg = str(result.get('error', 'Unknown error'))[:500]
+            update_scheduled_post_status(
+                pid,
+                status='failed',
+                error_message=error_msg,
+            )
+            app.logger.error("Scheduled %s post %d failed: %s", platform_name, pid, error_msg)
+    
+    except Exception as e:
+        app.logger.exception("Error processing scheduled post %d", pid)
+        update_scheduled_post_status(
+            pid,
+            status='failed',
+            error_message=str(e)[:500],
+        )
+
+
 def scheduled_post_worker() -> None:
     """Background thread that processes scheduled posts."""
-    import time as time_module
+    # Tokens are cached across cycles; refreshes update them in place and the
+    # cache is dropped hourly to pick up out-of-band changes (reconnects)
+    tokens = {'linkedin': None, 'threads': None, 'lock': threading.Lock()}
+    tokens_fetched_at = 0.0
+    publisher = ThreadPoolExecutor(
+        max_workers=SCHEDULER_PUBLISH_WORKERS,
+        thread_name_prefix='publish',
+    )
     
     while True:
         try:
-            # Check for pending posts every 60 seconds
-            time_module.sleep(60)
-            
-            # Get pending posts that are due
-            pending = get_pending_scheduled_posts()
+            # Sleep until the next post is due or the queue changes
+            wait_for_next_scheduled_post()
             
-            if not pending:
-                continue
-            
-            # Cache tokens to avoid repeated DB queries
-            linkedin_token = None
-            threads_token = None
-            
-            for post in pending:
-                try:
-                    platform = post['platform'] if 'platform' in post.keys() else 'linkedin'
-                    
-                    # Get article topic safely from sqlite3.Row
-                    article_topic = post['article_topic'] if 'article_topic' in post.keys() else None
-                    
-                    # Determine content and image based on post type
-                    image_url = None
-                    if post['post_type'] == 'social' and post['social_content']:
-                        content = post['social_content']
-                        image_url = post['social_image_url'] if 'social_image_url' in post.keys() else None
-                    elif post['post_type'] == 'article' and post['article_content']:
-                        content = f"{post['article_topic']}\n\n{post['article_content'][:2800]}"
-                    elif post['post_type'] == 'standalone' and post['standalone_content']:
-                        content = post['standalone_content']
-                        image_url = post['standalone_image_url'] if 'standalone_image_url' in post.keys() else None
-                    else:
-                        app.logger.warning("Scheduled post %d has no content", post['id'])
-                        update_scheduled_post_status(
-                            post['id'],
-                            status='failed',
-                            error_message='No content found',
-                        )
-                        continue
-                    
-                    result = None
-                    
-                    if platform == 'threads':
-                        # Handle Threads posting
-                        if threads_token is None:
-                            threads_token = get_threads_token()
-                        
-                        if not threads_token:
-                            app.logger.warning("Scheduled Threads post %d due but Threads not connected", post['id'])
-                            update_scheduled_post_status(
-                                post['id'],
-                                status='failed',
-                                error_message='Threads not connected',
-                            )
-                            continue
-                        
-                        # Check token expiry and refresh if needed
-                        if threads_is_token_expired(threads_token['expires_at']):
-                            threads_client = get_threads_client()
-                            try:
-                                new_token = threads_client.refresh_access_token(threads_token['access_token'])
-                                expires_at = threads_calculate_token_expiry(new_token.get('expires_in', 5184000))
-                                update_threads_token(
-                                    access_token=new_token['access_token'],
-                                    expires_at=expires_at,
-                                )
-                                threads_token = get_threads_token()
-                            except Exception as e:
-                                app.logger.error("Failed to refresh Threads token: %s", e)
-                                update_scheduled_post_status(
-                                    post['id'],
-                                    status='failed',
-                                    error_message='Threads token expired',
-                                )
-                                continue
-                        
-                        threads_client = get_threads_client()
-                        
-                        # Use image post if image URL is available
-                        if image_url:
-                            app.logger.info("Posting Threads with image: %s", image_url)
-                            result = threads_client.publish_image_post(
-                                access_token=threads_token['access_token'],
-                                text=content[:500],  # Threads has 500 char limit
-                                image_url=image_url,
-                            )
-                        else:
-                            result = threads_client.publish_text_post(
-                                access_token=threads_token['access_token'],
-                                text=content[:500],  # Threads has 500 char limit
-                            )
-                        
-                        if result['success']:
-                            update_scheduled_post_status(
-                                post['id'],
-                                status='posted',
-                                linkedin_post_urn=result.get('permalink'),  # Store permalink for view link
-                            )
-                            if post['social_post_id']:
-                                mark_social_post_used(post['social_post_id'], True)
-                            if post['standalone_post_id']:
-                                mark_standalone_post_used(post['standalone_post_id'], True)
-                            app.logger.info("Scheduled Threads post %d published successfully", post['id'])
-                        else:
-                            error_msg = str(result.get('error', 'Unknown error'))[:500]
-                            update_scheduled_post_status(
-                                post['id'],
-                                status='failed',
-                                error_message=error_msg,
-                            )
-                            app.logger.error("Scheduled Threads post %d failed: %s", post['id'], error_msg)
-                    
-                    else:
-                        # Handle LinkedIn posting (default)
-                        if linkedin_token is None:
-                            linkedin_token = get_linkedin_token()
-                        
-                        if not linkedin_token:
-                            app.logger.warning("Scheduled LinkedIn post %d due but LinkedIn not connected", post['id'])
-                            update_scheduled_post_status(
-                                post['id'],
-                                status='failed',
-                                error_message='LinkedIn not connected',
-                            )
-                            continue
-                        
-                        # Check token expiry and refresh if needed
-                        if is_token_expired(linkedin_token['expires_at']):
-                            linkedin_client = get_linkedin_client()
-                            if linkedin_token['refresh_token']:
-                                try:
-                                    new_token = linkedin_client.refresh_access_token(linkedin_token['refresh_token'])
-                                    expires_at = calculate_token_expiry(new_token.get('expires_in', 5184000))
-                                    update_linkedin_token(
-                                        access_token=new_token['access_token'],
-                                        expires_at=expires_at,
-                                        refresh_token=new_token.get('refresh_token'),
-                                    )
-                                    linkedin_token = get_linkedin_token()
-                                except Exception as e:
-                                    app.logger.error("Failed to refresh LinkedIn token: %s", e)
-                                    update_scheduled_post_status(
-                                        post['id'],
-                                        status='failed',
-                                        error_message='LinkedIn token expired',
-                                    )
-                                    continue
-                            else:
-                                app.logger.warning("LinkedIn token expired for post %d", post['id'])
-                                update_scheduled_post_status(
-                                    post['id'],
-                                    status='failed',
-                                    error_message='LinkedIn token expired',
-                                )
-                                continue
-                        
-                        linkedin_client = get_linkedin_client()
-                        
-                        # Use image post if image URL is available and no URL in content
-                        if image_url and not linkedin_client.extract_first_url(content):
-                            app.logger.info("Posting LinkedIn with image: %s", image_url)
-                            result = linkedin_client.create_image_post(
-                                access_token=linkedin_token['access_token'],
-                                author_urn=linkedin_token['user_urn'],
-                                text=content[:3000],
-                                image_url=image_url,
-                            )
-                        else:
-                            result = linkedin_client.create_smart_post(
-                                access_token=linkedin_token['access_token'],
-                                author_urn=linkedin_token['user_urn'],
-                                text=content[:3000],
-                                article_title=article_topic,
-                            )
-                        
-                        if result['success']:
-                            update_scheduled_post_status(
-                                post['id'],
-                                status='posted',
-                                linkedin_post_urn=result.get('post_urn'),
-                            )
-                            if post['social_post_id']:
-                                mark_social_post_used(post['social_post_id'], True)
-                            if post['standalone_post_id']:
-                                mark_standalone_post_used(post['standalone_post_id'], True)
-                            app.logger.info("Scheduled LinkedIn post %d published successfully", post['id'])
-                        else:
-                            error_msg = str(result.get('error', 'Unknown error'))[:500]
-                            update_scheduled_post_status(
-                                post['id'],
-                                status='failed',
-                                error_message=error_msg,
-                            )
-                            app.logger.error("Scheduled LinkedIn post %d failed: %s", post['id'], error_msg)
-                        
-                except Exception as e:
-                    app.logger.exception("Error processing scheduled post %d", post['id'])
-                    update_scheduled_post_status(
-                        post['id'],
-                        status='failed',
-                        error_message=str(e)[:500],
-                    )
+            # Drain due posts in bounded batches; skip any row that is still
+            # pending after an attempt so a stuck post can't spin this loop
+            cutoff = datetime.now().isoformat(timespec="seconds")
+            attempted = set()
+            while True:
+                pending = [
+                    post for post in get_pending_scheduled_posts(limit=SCHEDULER_BATCH_SIZE, before=cutoff)
+                    if post['id'] not in attempted
+                ]
+                if not pending:
+                    break
+                attempted.update(post['id'] for post in pending)
+                
+                if time.time() - tokens_fetched_at > SCHEDULER_TOKEN_TTL:
+                    with tokens['lock']:
+                        tokens['linkedin'] = None
+                        tokens['threads'] = None
+                    tokens_fetched_at = time.time()
+                
+                # Posts are independent and network-bound, so publish them in parallel
+                list(publisher.map(lambda post: _publish_scheduled_post(post, tokens), pending))
                     
         except Exception as e:
             app.logger.exception("Error in scheduled post worker")
@@ -4776,10 +5394,23 @@ def scheduled_post_worker() -> None:
 
 def start_workers():
     """Start all background worker threads."""
-    # Episode processing worker
-    episode_worker = threading.Thread(target=worker, daemon=True)
-    episode_worker.start()
-    app.logger.info("Episode processing worker started")
+    # Re-queue episodes a previous run left queued or mid-processing
+    for ep in list_unfinished_episodes():
+        if ep['item_type'] != 'audio':
+            # Text articles are processed in the request, not by the queue
+            continue
+        task_queue.put({
+            'url': ep['url'],
+            'title': ep['title'],
+            'feed_id': ep['feed_id'],
+            'published': ep['published'],
+        })
+    
+    # Episode processing workers
+    for _ in range(EPISODE_WORKERS):
+        episode_worker = threading.Thread(target=worker, daemon=True)
+        episode_worker.start()
+    app.logger.info("Started %d episode processing worker(s)", EPISODE_WORKERS)
     
     # Scheduled post worker
     scheduled_worker = threading.Thread(target=scheduled_post_worker, daemon=True)
@@ -4798,15 +5429,18 @@ if __name__ == '__main__':
     # - Not set in the parent process (reloader)
     # - Not set when running without reloader (production)
     
-    use_reloader = True  # Set to False for production
+    # FLASK_DEBUG=1 runs the Werkzeug dev server with the reloader and debugger;
+    # otherwise the app is served by waitress with a pool of request threads
+    use_reloader = os.environ.get('FLASK_DEBUG', '').lower() in ('1', 'true', 'yes')
+    port = int(os.environ.get('PORT', 5001))
     
     if use_reloader:
         # Only start workers in the child process (not the reloader parent)
         if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
             start_workers()
+        app.run(debug=True, host='0.0.0.0', port=port, use_reloader=True)
     else:
         # No reloader, just start the workers
         start_workers()
-    
-    # Run the Flask app
-    app.run(debug=use_reloader, host='0.0.0.0', port=int(os.environ.get('PORT', 5001)), use_reloader=use_reloader)
+        from waitress import serve
+        serve(app, host='0.0.0.0', port=port, threads=WEB_SERVER_THREADS)
@@ -10,6 +10,8 @@ from urllib.parse import urlencode
 from typing import Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +28,15 @@ THREADS_SCOPES = os.environ.get(
 )
 
 
+# Shared session so repeated API calls reuse keep-alive connections
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.3),
+))
+
+
 class ThreadsClient:
     """Client for interacting with Threads API."""
 
@@ -82,7 +93,7 @@ class ThreadsClient:
             "redirect_uri": self.redirect_uri,
         }
 
-        response = requests.post(
+        response = _session.post(
             f"{THREADS_API_HOST}/oauth/access_token",
             data=params,
             headers={"Content-Type": "application/x-www-form-urlencoded"},
@@ -106,7 +117,7 @@ class ThreadsClient:
             "access_token": short_lived_token,
         }
 
-        response = requests.get(
+        response = _session.get(
             f"{THREADS_API_HOST}/access_token",
             params=params,
             timeout=30,
@@ -128,7 +139,7 @@ class ThreadsClient:
             "access_token": access_token,
         }
 
-        response = requests.get(
+        response = _session.get(
             f"{THREADS_API_HOST}/refresh_access_token",
             params=params,
             timeout=30,
@@ -151,7 +162,7 @@ class ThreadsClient:
         }
 
         try:
-            response = requests.get(
+            response = _session.get(
                 f"{THREADS_API_HOST}/me",
                 params=params,
                 timeout=30,
@@ -203,7 +214,7 @@ class ThreadsClient:
 
         try:
             # Step 1: Create media container
-            response = requests.post(
+            response = _session.post(
                 f"{THREADS_API_HOST}/me/threads",
                 params=params,
                 timeout=30,
@@ -246,7 +257,7 @@ class ThreadsClient:
                     "fields": "status,error_message",
                     "access_token": access_token,
                 }
-                status_response = requests.get(
+                status_response = _session.get(
                     f"{THREADS_API_HOST}/{container_id}",
                     params=status_params,
                     timeout=10,
@@ -296,7 +307,7 @@ class ThreadsClient:
                 "access_token": access_token,
             }
 
-            publish_response = requests.post(
+            publish_response = _session.post(
                 f"{THREADS_API_HOST}/me/threads_publish",
                 params=publish_params,
                 timeout=30,
@@ -315,7 +326,7 @@ class ThreadsClient:
                             "fields": "permalink,shortcode",
                             "access_token": access_token,
                         }
-                        details_response = requests.get(
+                        details_response = _session.get(
                             f"{THREADS_API_HOST}/{post_id}",
                             params=details_params,
                             timeout=10,
@@ -418,7 +429,7 @@ class ThreadsClient:
         try:
             # Step 1: Create media container with image
             logger.info("Creating Threads image container with image: %s", image_url)
-            response = requests.post(
+            response = _session.post(
                 f"{THREADS_API_HOST}/me/threads",
                 params=params,
                 timeout=30,
@@ -460,7 +471,7 @@ class ThreadsClient:
                     "fields": "status,error_message",
                     "access_token": access_token,
                 }
-                status_response = requests.get(
+                status_response = _session.get(
                     f"{THREADS_API_HOST}/{container_id}",
                     params=status_params,
                     timeout=10,
@@ -513,7 +524,7 @@ class ThreadsClient:
                 "access_token": access_token,
             }
 
-            publish_response = requests.post(
+            publish_response = _session.post(
                 f"{THREADS_API_HOST}/me/threads_publish",
                 params=publish_params,
                 timeout=30,
@@ -532,7 +543,7 @@ class ThreadsClient:
                             "fields": "permalink,shortcode",
                             "access_token": access_token,
                         }
-                        details_response = requests.get(
+                        details_response = _session.get(
                             f"{THREADS_API_HOST}/{post_id}",
                             params=details_params,
                             timeout=10,
@@ -590,7 +601,7 @@ class ThreadsClient:
         }
 
         try:
-            response = requests.get(
+            response = _session.get(
                 f"{THREADS_API_HOST}/me/threads_publishing_limit",
                 params=params,
                 timeout=30,